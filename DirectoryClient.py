@@ -25,12 +25,113 @@ System Management:
 """
 
 import os
+import re
 import sys
+import json
+import time
+import atexit
 import argparse
-import yaml
 from pathlib import Path
 from collections import defaultdict, Counter
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+# (yaml module, loader, dumper) - imported on first use, since runs served
+# entirely from the frontmatter index (date fields included) never need PyYAML;
+# only new, changed or unindexable files trigger the import
+_yaml = None
+
+def _yaml_api():
+    """Import PyYAML, preferring the libyaml-backed loader/dumper when available"""
+    global _yaml
+    if _yaml is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+        except ImportError:
+            from yaml import SafeLoader, SafeDumper
+        _yaml = (yaml, SafeLoader, SafeDumper)
+    return _yaml
+
+def _yaml_load(text):
+    yaml, loader, _ = _yaml_api()
+    return yaml.load(text, Loader=loader)
+
+def _yaml_dump(data):
+    yaml, _, dumper = _yaml_api()
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+def _read_frontmatter(path, chunk_size=4096):
+    """Return the raw YAML frontmatter of a file, or None if it has none.
+    
+    Reads unbuffered bytes until the closing '---' shows up, which for typical
+    frontmatter is a single read and never touches the body.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buf = os.read(fd, chunk_size)
+        if not buf.startswith(b'---'):
+            return None
+        end = buf.find(b'\n---', 3)
+        while end == -1:
+            chunk = os.read(fd, chunk_size)
+            if not chunk:
+                return None
+            buf += chunk
+            end = buf.find(b'\n---', 3)
+    finally:
+        os.close(fd)
+    return buf[3:end].decode('utf-8')
+
+def _index_default(value):
+    """Encode the YAML date types JSON lacks as single-key tagged objects"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not indexable")
+
+def _index_object_hook(obj):
+    """Decode the tagged objects written by _index_default"""
+    if len(obj) == 1:
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+def _index_entry(data):
+    """Frontmatter fields worth persisting, or None if they don't survive a JSON round trip"""
+    entry = {k: v for k, v in data.items()
+             if k not in ('file_path', 'filename', 'body_content') and not k.startswith('_')}
+    try:
+        encoded = json.dumps(entry, default=_index_default)
+    except (TypeError, ValueError):
+        return None
+    # Non-string keys and other lossy conversions would come back different
+    if json.loads(encoded, object_hook=_index_object_hook) != entry:
+        return None
+    return entry
+
+# Clients whose index may need saving; a single atexit hook flushes them all
+_OPEN_CLIENTS = set()
+
+@atexit.register
+def _save_open_indexes():
+    for client in list(_OPEN_CLIENTS):
+        client._save_index()
+
+STATUS_ICON = {'n': '○', 's': '◐', 'b': '◑', 'd': '●'}
+HI_PRI = frozenset({'P0', 'P1'})
+DEEP_WORK_CATS = frozenset({'technical', 'writing', 'research'})
+# Contact name following "with"/"to"/"contact" in an outreach task title
+_NAME_RE = re.compile(r'\b(?:with|to|contact)\s+(\w+)', re.IGNORECASE)
+# A bullet line in BACKLOG.md
+_BULLET_RE = re.compile(r'^[ \t]*-', re.MULTILINE)
+
+# Threads only overlap the file reads (YAML parsing holds the GIL), so the pool is sized for I/O
+MAX_PARSE_WORKERS = 16
+# Uncached files in a batch before it's worth handing them to a thread pool
+PARALLEL_PARSE_MIN = 8
 
 class DirectoryClient:
     def __init__(self, base_dir=None):
@@ -51,66 +152,179 @@ class DirectoryClient:
         
         self.tasks_dir.mkdir(exist_ok=True)
         self.crm_dir.mkdir(exist_ok=True)
+        
+        # Parsed frontmatter keyed by path string -> (st_mtime_ns, st_size, data)
+        self._parse_cache = {}
+        # (CRM dir st_mtime_ns, contact count, frozenset of first names)
+        self._contact_firstnames_cache = (None, 0, frozenset())
+        # Files that failed to parse: path string -> error message (None if no frontmatter)
+        self._parse_errors = {}
+        # (st_mtime_ns, st_size) of each entry as loaded from the on-disk index
+        self._index_keys = {}
+        self._index_path = self.base_dir / '.dc_index.json'
+        self._index_dirty = False
+        self._load_index()
+        _OPEN_CLIENTS.add(self)
+    
+    def _load_index(self):
+        """Seed the parse cache from the on-disk frontmatter index"""
+        try:
+            index = json.loads(self._index_path.read_text(encoding='utf-8'),
+                               object_hook=_index_object_hook)
+        except (OSError, ValueError):
+            return
+        if not isinstance(index, dict):
+            return
+        
+        cache, keys = {}, {}
+        for rel_path, entry in index.items():
+            try:
+                mtime_ns, size, data = entry['mtime_ns'], entry['size'], entry['data']
+            except (TypeError, KeyError):
+                return
+            if not (type(mtime_ns) is int and type(size) is int and isinstance(data, dict)):
+                return
+            file_path = self.base_dir / rel_path
+            data['file_path'] = file_path
+            data['filename'] = file_path.name
+            cache[str(file_path)] = (mtime_ns, size, data)
+            keys[str(file_path)] = (mtime_ns, size)
+        
+        # Only a fully well-formed index is trusted; anything else starts from an empty cache
+        self._parse_cache, self._index_keys = cache, keys
+    
+    def _save_index(self):
+        """Write frontmatter parsed during this run back to the on-disk index"""
+        if not self._index_dirty:
+            return
+        
+        index = {}
+        for path, (mtime_ns, size, data) in self._parse_cache.items():
+            if not os.path.exists(path):
+                continue
+            entry = _index_entry(data)
+            if entry is None:
+                # Frontmatter JSON can't represent; these files are simply re-parsed next run
+                continue
+            index[os.path.relpath(path, self.base_dir)] = {
+                'mtime_ns': mtime_ns, 'size': size, 'data': entry
+            }
+        
+        # Replace the index atomically so concurrent runs never see a truncated file
+        tmp_path = self._index_path.with_name(f"{self._index_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(index, default=_index_default), encoding='utf-8')
+            os.replace(tmp_path, self._index_path)
+            self._index_dirty = False
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
     
     def parse_markdown_file(self, file_path):
         """Parse a markdown file and extract YAML frontmatter"""
+        return self.parse_markdown_header(file_path, want_body=True)
+    
+    def _is_cached(self, path, st, want_body=False):
+        """Whether the parse cache holds an up-to-date entry for this file"""
+        cached = self._parse_cache.get(path)
+        return bool(cached and cached[:2] == (st.st_mtime_ns, st.st_size)
+                    and (not want_body or 'body_content' in cached[2]))
+    
+    def parse_markdown_header(self, file_path, want_body=False, st=None):
+        """Parse only the YAML frontmatter, reading the body only when asked for"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            path = str(file_path)
+            if st is None:
+                st = os.stat(path)
+            if self._is_cached(path, st, want_body):
+                return self._parse_cache[path][2]
             
-            if not content.startswith('---'):
-                return None
+            yaml_content = None
+            if want_body:
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                # Same delimiter rule as _read_frontmatter, so both paths agree on every file
+                end = content.find('\n---', 3) if content.startswith('---') else -1
+                if end != -1:
+                    yaml_content = content[3:end]
+                    body_content = content[end + 4:].strip()
+            else:
+                yaml_content = _read_frontmatter(path)
             
-            parts = content.split('---', 2)
-            if len(parts) < 3:
+            if yaml_content is None:
+                self._parse_errors[path] = None
                 return None
             
-            yaml_content = parts[1].strip()
-            data = yaml.safe_load(yaml_content)
+            data = _yaml_load(yaml_content)
+            file_path = Path(path)
             data['file_path'] = file_path
             data['filename'] = file_path.name
-            data['body_content'] = parts[2].strip() if len(parts) > 2 else ""
+            if want_body:
+                data['body_content'] = body_content
             
+            key = (st.st_mtime_ns, st.st_size)
+            self._parse_cache[path] = key + (data,)
+            self._parse_errors.pop(path, None)
+            # Rewrite the index only when it would actually gain or change an entry
+            if self._index_keys.get(path) != key and _index_entry(data) is not None:
+                self._index_dirty = True
             return data
         except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
+            self._parse_errors[str(file_path)] = str(e)
             return None
     
+    def _iter_md(self, dir_path):
+        """Yield (name, path, stat) for each markdown file in a directory"""
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.name.endswith('.md') and entry.is_file():
+                    yield entry.name, entry.path, entry.stat()
+    
+    def _map_md(self, dir_path, func, want_body=False):
+        """Apply func(name, path, stat) to every markdown file, threading only larger batches of cache misses"""
+        entries = list(self._iter_md(dir_path))
+        misses = [i for i, (_, path, st) in enumerate(entries)
+                  if not self._is_cached(path, st, want_body)]
+        results = [None] * len(entries)
+        if len(misses) >= PARALLEL_PARSE_MIN:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(misses))) as ex:
+                for i, result in zip(misses, ex.map(lambda i: func(*entries[i]), misses)):
+                    results[i] = result
+            done = set(misses)
+        else:
+            done = ()
+        # Cache hits (and small batches of misses) are cheaper on the calling thread
+        for i, entry in enumerate(entries):
+            if i not in done:
+                results[i] = func(*entry)
+        return results
+    
     def get_all_tasks(self):
         """Get all tasks from the Tasks directory"""
-        tasks = []
-        for file_path in self.tasks_dir.glob('*.md'):
-            task_data = self.parse_markdown_file(file_path)
-            if task_data:
-                tasks.append(task_data)
-        return tasks
-    
-    def filter_tasks(self, tasks, category=None, priority=None, status=None):
+        results = self._map_md(self.tasks_dir,
+                               lambda name, path, st: self.parse_markdown_header(path, st=st))
+        return [t for t in results if t]
+    
+    def filter_tasks(self, tasks, category=None, priority=None, status=None, exclude_done=False):
         """Filter tasks based on criteria"""
-        filtered = tasks
-        
-        if category:
-            categories = [c.strip() for c in category.split(',')]
-            filtered = [t for t in filtered if t.get('category') in categories]
-        
-        if priority:
-            priorities = [p.strip() for p in priority.split(',')]
-            filtered = [t for t in filtered if t.get('priority') in priorities]
-        
-        if status:
-            statuses = [s.strip() for s in status.split(',')]
-            filtered = [t for t in filtered if t.get('status') in statuses]
-        
-        return filtered
+        cat_set = frozenset(c.strip() for c in category.split(',')) if category else None
+        pri_set = frozenset(p.strip() for p in priority.split(',')) if priority else None
+        stat_set = frozenset(s.strip() for s in status.split(',')) if status else None
+        
+        return [t for t in tasks
+                if (not exclude_done or t.get('status') != 'd')
+                and (cat_set is None or t.get('category') in cat_set)
+                and (pri_set is None or t.get('priority') in pri_set)
+                and (stat_set is None or t.get('status') in stat_set)]
     
     def list_tasks(self, category=None, priority=None, status=None, include_done=False):
         """List tasks with optional filters, hiding completed by default."""
         tasks = self.get_all_tasks()
-        
-        if not include_done and status is None:
-            tasks = [t for t in tasks if t.get('status') != 'd']
-            
-        filtered_tasks = self.filter_tasks(tasks, category, priority, status)
+        exclude_done = not include_done and status is None
+        filtered_tasks = self.filter_tasks(tasks, category, priority, status, exclude_done)
         
         if not filtered_tasks:
             print("No tasks found matching criteria.")
@@ -120,36 +334,46 @@ class DirectoryClient:
         for task in filtered_tasks:
             by_priority[task.get('priority', 'P2')].append(task)
         
+        icon_get = STATUS_ICON.get
+        out = []
         for priority in ['P0', 'P1', 'P2', 'P3']:
             if priority in by_priority:
-                print(f"\n=== {priority} Tasks ===")
+                out.append(f"\n=== {priority} Tasks ===")
                 for task in by_priority[priority]:
-                    status_icon = {'n': '○', 's': '◐', 'b': '◑', 'd': '●'}.get(task.get('status', 'n'), '?')
-                    print(f"{status_icon} [{(task.get('category') or 'other'):10}] {task.get('title', 'Untitled')} ({task['filename']})")
+                    status_icon = icon_get(task.get('status', 'n'), '?')
+                    out.append(f"{status_icon} [{(task.get('category') or 'other'):10}] {task.get('title', 'Untitled')} ({task['filename']})")
+        sys.stdout.write('\n'.join(out) + '\n')
 
     def prune_old_done_tasks(self, days_old=30):
         """Delete completed tasks older than a specified number of days."""
-        tasks = self.get_all_tasks()
-        done_tasks = [t for t in tasks if t.get('status') == 'd']
-        
-        if not done_tasks:
+        cutoff_ts = (datetime.now() - timedelta(days=days_old)).timestamp()
+        
+        # Recent files are only read until one done task proves there is something to report
+        old_done_tasks = []
+        any_done = False
+        for _, path, st in self._iter_md(self.tasks_dir):
+            is_old = st.st_mtime < cutoff_ts
+            if not is_old and any_done:
+                continue
+            task = self.parse_markdown_header(path, st=st)
+            if task and task.get('status') == 'd':
+                any_done = True
+                if is_old:
+                    old_done_tasks.append(task)
+        
+        if not any_done:
             print("No completed tasks to prune.")
             return
         
         pruned_count = 0
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        
-        for task in done_tasks:
-            file_path = Path(task['file_path'])
-            modified_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-            
-            if modified_time < cutoff_date:
-                try:
-                    file_path.unlink()
-                    pruned_count += 1
-                    print(f"Pruned old task: {task.get('title', file_path.name)}")
-                except Exception as e:
-                    print(f"Error pruning {file_path.name}: {e}")
+        for task in old_done_tasks:
+            file_path = task['file_path']
+            try:
+                file_path.unlink()
+                pruned_count += 1
+                print(f"Pruned old task: {task.get('title', file_path.name)}")
+            except Exception as e:
+                print(f"Error pruning {file_path.name}: {e}")
         
         print(f"\nPruned {pruned_count} completed tasks older than {days_old} days.")
 
@@ -161,25 +385,25 @@ class DirectoryClient:
             return False
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = file_path.read_text(encoding='utf-8')
             
             if not content.startswith('---'):
                 print("Invalid task file format (no YAML frontmatter)")
                 return False
             
-            parts = content.split('---', 2)
-            yaml_content = parts[1].strip()
-            body_content = parts[2] if len(parts) > 2 else ""
+            end = content.find('\n---', 3)
+            if end == -1:
+                end = len(content)
+            yaml_content = content[3:end].strip()
+            body_content = content[end + 4:]
             
-            task_data = yaml.safe_load(yaml_content)
+            task_data = _yaml_load(yaml_content)
             task_data['status'] = new_status
             
-            new_yaml = yaml.dump(task_data, default_flow_style=False, sort_keys=False)
+            new_yaml = _yaml_dump(task_data)
             new_content = f"---\n{new_yaml}---{body_content}"
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            self._write_atomic(file_path, new_content)
             
             print(f"Updated {task_file} status to '{new_status}'")
             return True
@@ -188,6 +412,12 @@ class DirectoryClient:
             print(f"Error updating {task_file}: {e}")
             return False
     
+    def _write_atomic(self, file_path, content):
+        """Write content to a temp file beside file_path, then rename it into place"""
+        tmp_path = file_path.with_suffix('.md.tmp')
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, file_path)
+    
     def start_task(self, task_file):
         """Mark a task as started"""
         return self.update_task_status(task_file, 's')
@@ -204,30 +434,31 @@ class DirectoryClient:
             print("No tasks found.")
             return
         
-        by_priority = Counter(t.get('priority', 'P2') for t in tasks)
-        by_category = Counter(t.get('category', 'other') for t in tasks)
-        by_status = Counter(t.get('status', 'n') for t in tasks)
+        by_priority, by_category, by_status = Counter(), Counter(), Counter()
+        for t in tasks:
+            by_priority[t.get('priority', 'P2')] += 1
+            by_category[t.get('category', 'other')] += 1
+            by_status[t.get('status', 'n')] += 1
         
-        print("=== Task Summary ===")
-        print(f"Total Tasks: {len(tasks)}")
+        out = ["=== Task Summary ===", f"Total Tasks: {len(tasks)}"]
         
-        print(f"\nBy Priority:")
+        out.append(f"\nBy Priority:")
         for priority in ['P0', 'P1', 'P2', 'P3']:
-            print(f"  {priority}: {by_priority.get(priority, 0)}")
+            out.append(f"  {priority}: {by_priority.get(priority, 0)}")
         
-        print(f"\nBy Category:")
+        out.append(f"\nBy Category:")
         for category, count in by_category.most_common():
-            print(f"  {category}: {count}")
+            out.append(f"  {category}: {count}")
         
-        print(f"\nBy Status:")
+        out.append(f"\nBy Status:")
         status_names = {'n': 'Not Started', 's': 'Started', 'b': 'Blocked', 'd': 'Done'}
         for status in ['n', 's', 'b', 'd']:
-            print(f"  {status_names.get(status, status)}: {by_status.get(status, 0)}")
+            out.append(f"  {status_names.get(status, status)}: {by_status.get(status, 0)}")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def check_priority_limits(self):
         """Check priority distribution and alert on high counts"""
-        tasks = [t for t in self.get_all_tasks() if t.get('status') != 'd']
-        by_priority = Counter(t.get('priority', 'P2') for t in tasks)
+        by_priority = Counter(t.get('priority', 'P2') for t in self.get_all_tasks() if t.get('status') != 'd')
         
         thresholds = {'P0': 3, 'P1': 5, 'P2': 10}  # Now just thresholds for alerts, not hard limits
         alerts = []
@@ -253,32 +484,47 @@ class DirectoryClient:
         else:
             print(f"\n✓ Priority distribution looks balanced")
     
-    def get_all_contacts(self):
+    def get_all_contacts(self, want_body=False):
         """Get all contacts from the CRM directory"""
-        contacts = []
-        for file_path in self.crm_dir.glob('*.md'):
-            contact_data = self.parse_markdown_file(file_path)
-            if contact_data:
-                contacts.append(contact_data)
-        return contacts
+        def parse_contact(name, path, st):
+            contact = self.parse_markdown_header(path, want_body, st)
+            # Lowercased copies for filtering/searching, computed once per parse
+            if contact and '_lc' not in contact:
+                contact['_lc'] = {k: str(contact.get(k) or '').lower()
+                                  for k in ('name', 'company', 'email', 'location')}
+            if contact and want_body and '_lc_body' not in contact:
+                contact['_lc_body'] = (contact.get('body_content') or '').lower()
+            return contact
+        
+        results = self._map_md(self.crm_dir, parse_contact, want_body)
+        return [c for c in results if c]
+    
+    def _contact_first_names(self):
+        """Return (contact count, first names), rebuilt only when CRM/ changes"""
+        mtime = os.stat(self.crm_dir).st_mtime_ns
+        if self._contact_firstnames_cache[0] != mtime:
+            contacts = self.get_all_contacts()
+            names = frozenset(c['name'].split()[0] for c in contacts if c.get('name'))
+            self._contact_firstnames_cache = (mtime, len(contacts), names)
+        return self._contact_firstnames_cache[1:]
+    
+    def _count_contacts(self):
+        """Count contact files without parsing them unless the name cache is already fresh"""
+        mtime, count, _ = self._contact_firstnames_cache
+        if mtime is not None and mtime == os.stat(self.crm_dir).st_mtime_ns:
+            return count
+        return sum(1 for _ in self._iter_md(self.crm_dir))
     
     def filter_contacts(self, contacts, location=None, company=None, name=None):
         """Filter contacts based on criteria"""
-        filtered = contacts
-        
-        if location:
-            locations = [l.strip().lower() for l in location.split(',')]
-            filtered = [c for c in filtered if (c.get('location') or '').lower() in locations]
-        
-        if company:
-            companies = [comp.strip().lower() for comp in company.split(',')]
-            filtered = [c for c in filtered if any(comp in (c.get('company') or '').lower() for comp in companies)]
-        
-        if name:
-            name_search = name.lower()
-            filtered = [c for c in filtered if name_search in (c.get('name') or '').lower()]
-        
-        return filtered
+        loc_set = frozenset(l.strip().lower() for l in location.split(',')) if location else None
+        companies = tuple(comp.strip().lower() for comp in company.split(',')) if company else None
+        name_search = name.lower() if name else None
+        
+        return [c for c in contacts
+                if (loc_set is None or c['_lc']['location'] in loc_set)
+                and (companies is None or any(comp in c['_lc']['company'] for comp in companies))
+                and (name_search is None or name_search in c['_lc']['name'])]
     
     def list_contacts(self, location=None, company=None, name=None):
         """List contacts with optional filters"""
@@ -293,16 +539,18 @@ class DirectoryClient:
         for contact in filtered_contacts:
             by_location[contact.get('location', 'Unknown')].append(contact)
         
+        out = []
         for location, location_contacts in by_location.items():
-            print(f"\n=== {location} ===")
+            out.append(f"\n=== {location} ===")
             for contact in location_contacts:
                 company = contact.get('company', 'No company')
                 email = contact.get('email', 'No email')
                 last_contact = contact.get('last_contact', 'Never')
                 relationship = contact.get('relationship_strength', 'unknown')
                 
-                print(f"• {contact.get('name', 'Unknown')} @ {company}")
-                print(f"  Email: {email} | Last contact: {last_contact} | Relationship: {relationship}")
+                out.append(f"• {contact.get('name', 'Unknown')} @ {company}")
+                out.append(f"  Email: {email} | Last contact: {last_contact} | Relationship: {relationship}")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def add_contact(self, name, email=None, company=None, location=None, phone=None, linkedin=None):
         """Add a new contact to CRM"""
@@ -322,7 +570,7 @@ class DirectoryClient:
         }
         
         contact_data = {k: v for k, v in contact_data.items() if v}
-        yaml_content = yaml.dump(contact_data, default_flow_style=False, sort_keys=False)
+        yaml_content = _yaml_dump(contact_data)
         
         content = f"""---
 {yaml_content}---
@@ -358,33 +606,43 @@ class DirectoryClient:
     
     def update_contact_field(self, name, field, value):
         """Update a specific field for a contact"""
+        name_lower = name.lower()
         file_path = None
-        for f_path in self.crm_dir.glob('*.md'):
-            contact_data = self.parse_markdown_file(f_path)
-            if contact_data and contact_data.get('name', '').lower() == name.lower():
-                file_path = f_path
-                break
+        
+        # add_contact names files after the contact, so try that file first
+        candidate = self.crm_dir / (name.replace('.', '') + '.md')
+        if candidate.is_file():
+            contact_data = self.parse_markdown_header(candidate)
+            if contact_data and contact_data.get('name', '').lower() == name_lower:
+                file_path = candidate
+        
+        if not file_path:
+            for _, path, st in self._iter_md(self.crm_dir):
+                contact_data = self.parse_markdown_header(path, st=st)
+                if contact_data and contact_data.get('name', '').lower() == name_lower:
+                    file_path = contact_data['file_path']
+                    break
         
         if not file_path:
             print(f"Contact {name} not found.")
             return False
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = file_path.read_text(encoding='utf-8')
             
-            parts = content.split('---', 2)
-            yaml_content = parts[1].strip()
-            body_content = parts[2] if len(parts) > 2 else ""
+            end = content.find('\n---', 3)
+            if end == -1:
+                end = len(content)
+            yaml_content = content[3:end].strip()
+            body_content = content[end + 4:]
             
-            contact_data = yaml.safe_load(yaml_content)
+            contact_data = _yaml_load(yaml_content)
             contact_data[field] = value
             
-            new_yaml = yaml.dump(contact_data, default_flow_style=False, sort_keys=False)
+            new_yaml = _yaml_dump(contact_data)
             new_content = f"---\n{new_yaml}---{body_content}"
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            self._write_atomic(file_path, new_content)
             
             print(f"Updated {name} {field} to '{value}'")
             return True
@@ -395,23 +653,20 @@ class DirectoryClient:
     
     def search_contacts(self, query):
         """Search contacts by name, company, or content"""
-        contacts = self.get_all_contacts()
+        contacts = self.get_all_contacts(want_body=True)
         query_lower = query.lower()
         
-        matches = [c for c in contacts if 
-                   query_lower in (c.get('name') or '').lower() or
-                   query_lower in (c.get('company') or '').lower() or
-                   query_lower in str(c.get('email') or '').lower() or
-                   query_lower in (c.get('location') or '').lower() or
-                   query_lower in (c.get('body_content') or '').lower()]
+        matches = [c for c in contacts
+                   if any(query_lower in v for v in c['_lc'].values()) or query_lower in c['_lc_body']]
         
         if not matches:
             print(f"No contacts found matching '{query}'")
             return
         
-        print(f"\n=== Search Results for '{query}' ===")
+        out = [f"\n=== Search Results for '{query}' ==="]
         for contact in matches:
-            print(f"• {contact.get('name', 'Unknown')} @ {contact.get('company', 'No company')} ({contact['filename']})")
+            out.append(f"• {contact.get('name', 'Unknown')} @ {contact.get('company', 'No company')} ({contact['filename']})")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def crm_summary(self):
         """Show CRM summary statistics"""
@@ -421,58 +676,50 @@ class DirectoryClient:
             print("No contacts found.")
             return
         
-        by_location = Counter(c.get('location', 'Unknown') for c in contacts)
-        by_company = Counter(c.get('company', 'Unknown') for c in contacts)
-        by_relationship = Counter(c.get('relationship_strength', 'unknown') for c in contacts)
+        by_location, by_company, by_relationship = Counter(), Counter(), Counter()
+        for c in contacts:
+            by_location[c.get('location', 'Unknown')] += 1
+            by_company[c.get('company', 'Unknown')] += 1
+            by_relationship[c.get('relationship_strength', 'unknown')] += 1
         
-        print("=== CRM Summary ===")
-        print(f"Total Contacts: {len(contacts)}")
+        out = ["=== CRM Summary ===", f"Total Contacts: {len(contacts)}"]
         
-        print(f"\nBy Location:")
+        out.append(f"\nBy Location:")
         for location, count in by_location.most_common():
-            print(f"  {location}: {count}")
+            out.append(f"  {location}: {count}")
         
-        print(f"\nTop 10 Companies:")
+        out.append(f"\nTop 10 Companies:")
         for company, count in by_company.most_common(10):
-            print(f"  {company}: {count}")
+            out.append(f"  {company}: {count}")
         
-        print(f"\nBy Relationship Strength:")
+        out.append(f"\nBy Relationship Strength:")
         for strength, count in by_relationship.most_common():
-            print(f"  {strength}: {count}")
+            out.append(f"  {strength}: {count}")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def double_check_work(self):
         """Double-check system integrity and recent work"""
-        print("=== Double-Checking System Integrity ===\n")
+        out = ["=== Double-Checking System Integrity ===\n"]
         
-        # Check for tasks without proper YAML frontmatter
-        print("1. Checking task file integrity...")
+        # Check for tasks without proper YAML frontmatter, as recorded while parsing
+        out.append("1. Checking task file integrity...")
+        all_tasks = self.get_all_tasks()
+        tasks_dir = str(self.tasks_dir)
         malformed_tasks = []
-        for task_file in self.tasks_dir.glob('*.md'):
-            try:
-                with open(task_file, 'r') as f:
-                    content = f.read()
-                    if not content.startswith('---'):
-                        malformed_tasks.append(task_file.name)
-                    else:
-                        # Try to parse YAML
-                        parts = content.split('---', 2)
-                        if len(parts) < 3:
-                            malformed_tasks.append(task_file.name)
-                        else:
-                            yaml.safe_load(parts[1])
-            except Exception as e:
-                malformed_tasks.append(f"{task_file.name} (Error: {str(e)})")
+        for path, error in sorted(self._parse_errors.items()):
+            task_name = os.path.basename(path)
+            if os.path.dirname(path) == tasks_dir:
+                malformed_tasks.append(f"{task_name} (Error: {error})" if error else task_name)
         
         if malformed_tasks:
-            print(f"   ⚠️  Found {len(malformed_tasks)} tasks with issues:")
+            out.append(f"   ⚠️  Found {len(malformed_tasks)} tasks with issues:")
             for task in malformed_tasks:
-                print(f"      - {task}")
+                out.append(f"      - {task}")
         else:
-            print("   ✓ All task files properly formatted")
+            out.append("   ✓ All task files properly formatted")
         
         # Check priority distribution
-        print("\n2. Checking priority distribution...")
-        all_tasks = self.get_all_tasks()
+        out.append("\n2. Checking priority distribution...")
         tasks = [t for t in all_tasks if t.get('status') != 'd']  # Exclude done tasks
         priority_counts = Counter(task['priority'] for task in tasks)
         
@@ -484,63 +731,60 @@ class DirectoryClient:
                 high_priority_alerts.append(f"{priority}: {count} tasks (typical threshold: {threshold})")
         
         if high_priority_alerts:
-            print("   💡 High priority concentration:")
+            out.append("   💡 High priority concentration:")
             for alert in high_priority_alerts:
-                print(f"      - {alert}")
+                out.append(f"      - {alert}")
         else:
-            print("   ✓ Priority distribution is balanced")
+            out.append("   ✓ Priority distribution is balanced")
         
         # Check for duplicate tasks
-        print("\n3. Checking for duplicate tasks...")
+        out.append("\n3. Checking for duplicate tasks...")
         task_titles = [task['title'] for task in tasks]
         duplicates = [title for title, count in Counter(task_titles).items() if count > 1]
         
         if duplicates:
-            print(f"   ⚠️  Found {len(duplicates)} duplicate task titles:")
+            out.append(f"   ⚠️  Found {len(duplicates)} duplicate task titles:")
             for dup in duplicates:
-                print(f"      - {dup}")
+                out.append(f"      - {dup}")
         else:
-            print("   ✓ No duplicate tasks found")
+            out.append("   ✓ No duplicate tasks found")
         
         # Check for orphaned CRM contacts (mentioned in tasks but no CRM file)
-        print("\n4. Checking CRM consistency...")
+        out.append("\n4. Checking CRM consistency...")
         crm_names_in_tasks = set()
         for task in tasks:
             if task['category'] == 'outreach':
                 # Simple name extraction from title
-                title_words = task['title'].lower().split()
-                for i, word in enumerate(title_words):
-                    if word in ['with', 'to', 'contact']:
-                        if i + 1 < len(title_words):
-                            crm_names_in_tasks.add(title_words[i + 1].title())
+                crm_names_in_tasks.update(m.title() for m in _NAME_RE.findall(task['title']))
         
-        existing_contacts = set(c['name'].split()[0] for c in self.get_all_contacts() if c.get('name'))
+        _, existing_contacts = self._contact_first_names()
         missing_contacts = crm_names_in_tasks - existing_contacts
         
         if missing_contacts:
-            print(f"   ⚠️  Contacts mentioned in tasks but not in CRM:")
+            out.append(f"   ⚠️  Contacts mentioned in tasks but not in CRM:")
             for contact in missing_contacts:
-                print(f"      - {contact}")
+                out.append(f"      - {contact}")
         else:
-            print("   ✓ CRM and tasks are consistent")
+            out.append("   ✓ CRM and tasks are consistent")
         
         # Recent activity check
-        print("\n5. Recent activity (last 7 days)...")
-        recent_date = datetime.now() - timedelta(days=7)
+        out.append("\n5. Recent activity (last 7 days)...")
+        recent_ts = (datetime.now() - timedelta(days=7)).timestamp()
         recent_tasks = []
         
-        for task_file in self.tasks_dir.glob('*.md'):
-            if task_file.stat().st_mtime > recent_date.timestamp():
-                recent_tasks.append(task_file.name)
+        for task_name, _, st in self._iter_md(self.tasks_dir):
+            if st.st_mtime > recent_ts:
+                recent_tasks.append(task_name)
         
         if recent_tasks:
-            print(f"   Recently modified tasks ({len(recent_tasks)}):")
+            out.append(f"   Recently modified tasks ({len(recent_tasks)}):")
             for task in recent_tasks[-5:]:  # Show last 5
-                print(f"      - {task}")
+                out.append(f"      - {task}")
             if len(recent_tasks) > 5:
-                print(f"      ... and {len(recent_tasks) - 5} more")
+                out.append(f"      ... and {len(recent_tasks) - 5} more")
         else:
-            print("   No recent task activity")
+            out.append("   No recent task activity")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     def anticipate_next(self):
         """Anticipate next questions/tasks and suggest proactive actions"""
@@ -552,7 +796,7 @@ class DirectoryClient:
         
         # Group tasks by status and priority
         started_tasks = [t for t in tasks if t['status'] == 's']
-        not_started_high_pri = [t for t in tasks if t['status'] == 'n' and t['priority'] in ['P0', 'P1']]
+        not_started_high_pri = [t for t in tasks if t['status'] == 'n' and t['priority'] in HI_PRI]
         blocked_tasks = [t for t in tasks if t['status'] == 'b']
         
         suggestions = []
@@ -607,7 +851,7 @@ class DirectoryClient:
                     'command': "python DirectoryClient.py list --category outreach --status n"
                 })
         elif 14 <= current_hour < 17:  # Afternoon
-            deep_work = [t for t in tasks if t['category'] in ['technical', 'writing', 'research'] 
+            deep_work = [t for t in tasks if t['category'] in DEEP_WORK_CATS 
                         and t['status'] == 'n']
             if deep_work:
                 suggestions.append({
@@ -618,8 +862,9 @@ class DirectoryClient:
         
         # 6. Maintenance suggestions
         done_tasks = [t for t in all_tasks if t['status'] == 'd']  # Use all_tasks from above
+        now = datetime.now()
         old_done = [t for t in done_tasks 
-                   if (datetime.now() - datetime.fromisoformat(t.get('completed_date', '2020-01-01'))).days > 30]
+                   if (now - datetime.fromisoformat(t.get('completed_date', '2020-01-01'))).days > 30]
         if len(old_done) > 10:
             suggestions.append({
                 'type': 'Maintenance',
@@ -668,206 +913,251 @@ class DirectoryClient:
     
     def status(self):
         """Show comprehensive system status with actionable insights"""
-        print("=== 📊 Current System Status ===\n")
+        out = ["=== 📊 Current System Status ===\n"]
         
         # Get all tasks
         all_tasks = self.get_all_tasks()
-        active_tasks = [t for t in all_tasks if t.get('status') != 'd']
+        
+        # Split off done tasks and categorize active ones in a single pass
+        active_tasks, done_tasks = [], []
+        priority_counts, status_counts, category_counts = Counter(), Counter(), Counter()
+        started, not_started = [], []
+        first_high_pri, high_pri_waiting = None, 0
+        outreach_available = deep_work = 0
+        total_estimate = p0p1_estimate = 0
+        crm_names_in_tasks = set()
+        for t in all_tasks:
+            st = t.get('status', 'n')
+            if st == 'd':
+                done_tasks.append(t)
+                continue
+            active_tasks.append(t)
+            cat, pri = t.get('category', 'other'), t.get('priority', 'P2')
+            est = t.get('estimated_time', 0)
+            priority_counts[pri] += 1
+            status_counts[st] += 1
+            category_counts[cat] += 1
+            total_estimate += est
+            
+            if pri in HI_PRI:
+                p0p1_estimate += est
+                if st == 'n':
+                    high_pri_waiting += 1
+                    if first_high_pri is None:
+                        first_high_pri = t
+            
+            if st == 's':
+                if len(started) < 3:
+                    started.append(t)
+            elif st == 'n':
+                not_started.append(t)
+                if cat == 'outreach':
+                    outreach_available += 1
+                elif cat in DEEP_WORK_CATS:
+                    deep_work += 1
+            
+            if cat == 'outreach':
+                crm_names_in_tasks.update(m.title() for m in _NAME_RE.findall(t.get('title', '')))
         
         # Priority distribution
-        priority_counts = Counter(task['priority'] for task in active_tasks)
         limits = {'P0': 3, 'P1': 5, 'P2': 10}
         
-        print("## Priority Distribution:")
+        out.append("## Priority Distribution:")
         for priority in ['P0', 'P1', 'P2', 'P3']:
             count = priority_counts.get(priority, 0)
             if priority in limits:
                 threshold = limits[priority]
                 if count > threshold:
-                    print(f"- **{priority}**: {count} ⚠️ (above typical threshold of {threshold})")
+                    out.append(f"- **{priority}**: {count} ⚠️ (above typical threshold of {threshold})")
                 else:
-                    print(f"- **{priority}**: {count}")
+                    out.append(f"- **{priority}**: {count}")
             else:
-                print(f"- **{priority}**: {count}")
+                out.append(f"- **{priority}**: {count}")
         
         # Add a note if there are many high-priority items
         high_pri_count = priority_counts.get('P0', 0) + priority_counts.get('P1', 0)
         if high_pri_count > 5:
-            print(f"\n💡 Note: You have {high_pri_count} high-priority (P0/P1) tasks - consider if they're all truly urgent")
+            out.append(f"\n💡 Note: You have {high_pri_count} high-priority (P0/P1) tasks - consider if they're all truly urgent")
         
         # Task status overview
-        print("\n## Task Status:")
-        status_counts = Counter(task['status'] for task in active_tasks)
+        out.append("\n## Task Status:")
         status_map = {'n': 'Not Started', 's': 'In Progress', 'b': 'Blocked'}
         
         for status_code, status_name in status_map.items():
             count = status_counts.get(status_code, 0)
             if count > 0:
-                print(f"- {status_name}: {count}")
+                out.append(f"- {status_name}: {count}")
                 if status_code == 's':
-                    started = [t for t in active_tasks if t['status'] == 's']
-                    for task in started[:3]:
-                        print(f"  → {task['title']}")
+                    for task in started:
+                        out.append(f"  → {task['title']}")
         
         # Category breakdown
-        print("\n## Category Distribution:")
-        category_counts = Counter(task['category'] for task in active_tasks)
+        out.append("\n## Category Distribution:")
         for category, count in category_counts.most_common():
             percentage = (count / len(active_tasks)) * 100 if active_tasks else 0
-            print(f"- {category}: {count} ({percentage:.0f}%)")
+            out.append(f"- {category}: {count} ({percentage:.0f}%)")
         
         # Time-based insights
         current_hour = datetime.now().hour
         current_day = datetime.now().strftime('%A')
         
-        print(f"\n## 💡 Time-Based Insights ({current_day}, {current_hour}:00):")
+        out.append(f"\n## 💡 Time-Based Insights ({current_day}, {current_hour}:00):")
         
         if 9 <= current_hour < 12:
-            outreach_available = [t for t in active_tasks if t['category'] == 'outreach' and t['status'] == 'n']
             if outreach_available:
-                print(f"- Morning is ideal for outreach - you have {len(outreach_available)} outreach tasks")
+                out.append(f"- Morning is ideal for outreach - you have {outreach_available} outreach tasks")
         elif 14 <= current_hour < 17:
-            deep_work = [t for t in active_tasks if t['category'] in ['technical', 'writing', 'research'] and t['status'] == 'n']
             if deep_work:
-                print(f"- Afternoon deep work time - {len(deep_work)} technical/writing tasks available")
+                out.append(f"- Afternoon deep work time - {deep_work} technical/writing tasks available")
         elif current_hour >= 17:
-            print("- Evening: Good time for planning tomorrow or quick admin tasks")
+            out.append("- Evening: Good time for planning tomorrow or quick admin tasks")
         
         if current_day == 'Friday':
-            print("- It's Friday! Consider doing a weekly review")
+            out.append("- It's Friday! Consider doing a weekly review")
         
         # High priority items needing attention
-        print("\n## 🎯 Immediate Actions:")
+        out.append("\n## 🎯 Immediate Actions:")
         
         # P0/P1 not started
-        high_pri_not_started = [t for t in active_tasks if t['priority'] in ['P0', 'P1'] and t['status'] == 'n']
-        if high_pri_not_started:
-            print(f"1. Start a high-priority task ({len(high_pri_not_started)} P0/P1 tasks waiting)")
-            print(f"   → {high_pri_not_started[0]['title']}")
+        if first_high_pri is not None:
+            out.append(f"1. Start a high-priority task ({high_pri_waiting} P0/P1 tasks waiting)")
+            out.append(f"   → {first_high_pri['title']}")
         
         # Blocked tasks
-        blocked = [t for t in active_tasks if t['status'] == 'b']
-        if blocked:
-            print(f"2. Review {len(blocked)} blocked task(s) - might be unblocked now")
-        
-        # Aging tasks
-        old_not_started = []
-        for task in active_tasks:
-            if task['status'] == 'n':
-                try:
-                    file_path = self.tasks_dir / task['filename']
-                    age_days = (datetime.now() - datetime.fromtimestamp(file_path.stat().st_ctime)).days
-                    if age_days > 7:
-                        old_not_started.append((task, age_days))
-                except:
-                    pass
-        
-        if old_not_started:
-            oldest = sorted(old_not_started, key=lambda x: x[1], reverse=True)[0]
-            print(f"3. Address aging tasks - '{oldest[0]['title']}' is {oldest[1]} days old")
+        blocked_count = status_counts.get('b', 0)
+        if blocked_count:
+            out.append(f"2. Review {blocked_count} blocked task(s) - might be unblocked now")
+        
+        # Aging tasks - one directory scan, stat()ing only the not-started files by name
+        oldest_task, oldest_age = None, 7
+        if not_started:
+            not_started_names = {t['filename'] for t in not_started}
+            try:
+                with os.scandir(self.tasks_dir) as it:
+                    ctimes = {e.name: e.stat().st_ctime for e in it if e.name in not_started_names}
+            except OSError:
+                ctimes = {}
+            now_ts = time.time()
+            for task in not_started:
+                ctime = ctimes.get(task['filename'])
+                if ctime is not None:
+                    age_days = int((now_ts - ctime) // 86400)
+                    if age_days > oldest_age:
+                        oldest_task, oldest_age = task, age_days
+        
+        if oldest_task is not None:
+            out.append(f"3. Address aging tasks - '{oldest_task['title']}' is {oldest_age} days old")
         
         # System health
-        print("\n## 🔍 System Health:")
+        out.append("\n## 🔍 System Health:")
         
         # Check for missing CRM entries
-        crm_names_in_tasks = set()
-        for task in active_tasks:
-            if task['category'] == 'outreach':
-                title_words = task['title'].lower().split()
-                for i, word in enumerate(title_words):
-                    if word in ['with', 'to', 'contact']:
-                        if i + 1 < len(title_words):
-                            crm_names_in_tasks.add(title_words[i + 1].title())
-        
-        contacts = self.get_all_contacts()
-        existing_names = set(c['name'].split()[0] for c in contacts if c.get('name'))
-        missing_crm = crm_names_in_tasks - existing_names
+        # Contacts are only parsed when an outreach task actually names someone
+        if crm_names_in_tasks:
+            contacts_count, existing_names = self._contact_first_names()
+            missing_crm = crm_names_in_tasks - existing_names
+        else:
+            contacts_count, missing_crm = self._count_contacts(), None
         
         if missing_crm:
-            print(f"- ⚠️ {len(missing_crm)} contacts mentioned in tasks but not in CRM: {', '.join(missing_crm)}")
+            out.append(f"- ⚠️ {len(missing_crm)} contacts mentioned in tasks but not in CRM: {', '.join(missing_crm)}")
         else:
-            print("- ✓ CRM and tasks are in sync")
+            out.append("- ✓ CRM and tasks are in sync")
         
         # Done tasks ready for cleanup
-        done_tasks = [t for t in all_tasks if t['status'] == 'd']
         if len(done_tasks) > 10:
-            print(f"- ℹ️ {len(done_tasks)} completed tasks (run 'prune-tasks' to clean up)")
+            out.append(f"- ℹ️ {len(done_tasks)} completed tasks (run 'prune-tasks' to clean up)")
         
         # Quick stats
-        print(f"\n## 📈 Quick Stats:")
-        print(f"- Total active tasks: {len(active_tasks)}")
-        print(f"- Total contacts in CRM: {len(contacts)}")
+        out.append(f"\n## 📈 Quick Stats:")
+        out.append(f"- Total active tasks: {len(active_tasks)}")
+        out.append(f"- Total contacts in CRM: {contacts_count}")
         
         if active_tasks:
-            total_estimate = sum(t.get('estimated_time', 0) for t in active_tasks)
-            print(f"- Total estimated time: {total_estimate} minutes ({total_estimate/60:.1f} hours)")
+            out.append(f"- Total estimated time: {total_estimate} minutes ({total_estimate/60:.1f} hours)")
             
-            p0p1_estimate = sum(t.get('estimated_time', 0) for t in active_tasks if t['priority'] in ['P0', 'P1'])
             if p0p1_estimate:
-                print(f"- P0/P1 time commitment: {p0p1_estimate} minutes ({p0p1_estimate/60:.1f} hours)")
+                out.append(f"- P0/P1 time commitment: {p0p1_estimate} minutes ({p0p1_estimate/60:.1f} hours)")
         
         # Backlog check
+        # A cleared backlog ('all done!') has no bullets, so it needs no special case
         backlog_file = self.base_dir / 'BACKLOG.md'
-        if backlog_file.exists():
-            with open(backlog_file, 'r') as f:
-                content = f.read().strip()
-                if content and content != 'all done!':
-                    lines = len([l for l in content.split('\n') if l.strip() and l.strip().startswith('-')])
-                    if lines > 0:
-                        print(f"\n⚠️ BACKLOG.md has {lines} items to process!")
+        try:
+            backlog_size = backlog_file.stat().st_size
+        except OSError:
+            backlog_size = 0
+        if backlog_size:
+            lines = len(_BULLET_RE.findall(backlog_file.read_text()))
+            if lines > 0:
+                out.append(f"\n⚠️ BACKLOG.md has {lines} items to process!")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
+
+# (command, help, [(flags, add_argument kwargs)], handler(client, args))
+COMMANDS = [
+    ('list', 'List tasks, hiding completed by default', [
+        ('--category', {'help': 'Filter by category (comma-separated)'}),
+        ('--priority', {'help': 'Filter by priority (comma-separated)'}),
+        ('--status', {'help': 'Filter by status (comma-separated)'}),
+        ('--include-done', {'action': 'store_true', 'help': 'Include completed tasks'}),
+    ], lambda c, a: c.list_tasks(a.category, a.priority, a.status, a.include_done)),
+    ('prune-tasks', 'Delete completed tasks older than a specified time', [
+        ('--days-old', {'type': int, 'default': 30, 'help': 'Days old to be considered for pruning'}),
+    ], lambda c, a: c.prune_old_done_tasks(a.days_old)),
+    ('update-status', 'Update task status', [
+        ('task_file', {'help': 'Task filename'}),
+        ('status', {'choices': ['n', 's', 'b', 'd'], 'help': 'New status'}),
+    ], lambda c, a: c.update_task_status(a.task_file, a.status)),
+    ('start', 'Mark task as started', [
+        ('task_file', {'help': 'Task filename'}),
+    ], lambda c, a: c.start_task(a.task_file)),
+    ('complete', 'Mark task as completed', [
+        ('task_file', {'help': 'Task filename'}),
+    ], lambda c, a: c.complete_task(a.task_file)),
+    ('summary', 'Show task summary statistics', [],
+     lambda c, a: c.show_summary()),
+    ('check-limits', 'Check priority distribution and alert on high concentrations', [],
+     lambda c, a: c.check_priority_limits()),
+    ('crm-list', 'List CRM contacts', [
+        ('--location', {'help': 'Filter by location'}),
+        ('--company', {'help': 'Filter by company'}),
+        ('--name', {'help': 'Filter by name'}),
+    ], lambda c, a: c.list_contacts(a.location, a.company, a.name)),
+    ('crm-add', 'Add new contact', [
+        ('name', {'help': 'Contact name'}),
+        ('--email', {'help': 'Email address'}),
+        ('--company', {'help': 'Company name'}),
+        ('--location', {'help': 'Location'}),
+        ('--phone', {'help': 'Phone number'}),
+        ('--linkedin', {'help': 'LinkedIn URL'}),
+    ], lambda c, a: c.add_contact(a.name, a.email, a.company, a.location, a.phone, a.linkedin)),
+    ('crm-update', 'Update contact field', [
+        ('name', {'help': 'Contact name'}),
+        ('field', {'help': 'Field to update'}),
+        ('value', {'help': 'New value'}),
+    ], lambda c, a: c.update_contact_field(a.name, a.field, a.value)),
+    ('crm-search', 'Search contacts', [
+        ('query', {'help': 'Search query'}),
+    ], lambda c, a: c.search_contacts(a.query)),
+    ('crm-summary', 'Show CRM summary statistics', [],
+     lambda c, a: c.crm_summary()),
+    ('double-check', 'Double-check system integrity and recent work', [],
+     lambda c, a: c.double_check_work()),
+    ('anticipate', 'Anticipate next questions/tasks and suggest actions', [],
+     lambda c, a: c.anticipate_next()),
+    ('status', 'Show comprehensive system status with actionable insights', [],
+     lambda c, a: c.status()),
+]
 
 def main():
     parser = argparse.ArgumentParser(description='DirectoryClient - TODO System CLI Tool')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    list_parser = subparsers.add_parser('list', help='List tasks, hiding completed by default')
-    list_parser.add_argument('--category', help='Filter by category (comma-separated)')
-    list_parser.add_argument('--priority', help='Filter by priority (comma-separated)')
-    list_parser.add_argument('--status', help='Filter by status (comma-separated)')
-    list_parser.add_argument('--include-done', action='store_true', help='Include completed tasks')
-    
-    prune_parser = subparsers.add_parser('prune-tasks', help='Delete completed tasks older than a specified time')
-    prune_parser.add_argument('--days-old', type=int, default=30, help='Days old to be considered for pruning')
-
-    update_parser = subparsers.add_parser('update-status', help='Update task status')
-    update_parser.add_argument('task_file', help='Task filename')
-    update_parser.add_argument('status', choices=['n', 's', 'b', 'd'], help='New status')
-    
-    start_parser = subparsers.add_parser('start', help='Mark task as started')
-    start_parser.add_argument('task_file', help='Task filename')
-    
-    complete_parser = subparsers.add_parser('complete', help='Mark task as completed')
-    complete_parser.add_argument('task_file', help='Task filename')
-    
-    subparsers.add_parser('summary', help='Show task summary statistics')
-    subparsers.add_parser('check-limits', help='Check priority distribution and alert on high concentrations')
-    
-    crm_list_parser = subparsers.add_parser('crm-list', help='List CRM contacts')
-    crm_list_parser.add_argument('--location', help='Filter by location')
-    crm_list_parser.add_argument('--company', help='Filter by company')
-    crm_list_parser.add_argument('--name', help='Filter by name')
-    
-    crm_add_parser = subparsers.add_parser('crm-add', help='Add new contact')
-    crm_add_parser.add_argument('name', help='Contact name')
-    crm_add_parser.add_argument('--email', help='Email address')
-    crm_add_parser.add_argument('--company', help='Company name')
-    crm_add_parser.add_argument('--location', help='Location')
-    crm_add_parser.add_argument('--phone', help='Phone number')
-    crm_add_parser.add_argument('--linkedin', help='LinkedIn URL')
-    
-    crm_update_parser = subparsers.add_parser('crm-update', help='Update contact field')
-    crm_update_parser.add_argument('name', help='Contact name')
-    crm_update_parser.add_argument('field', help='Field to update')
-    crm_update_parser.add_argument('value', help='New value')
-    
-    crm_search_parser = subparsers.add_parser('crm-search', help='Search contacts')
-    crm_search_parser.add_argument('query', help='Search query')
-    
-    subparsers.add_parser('crm-summary', help='Show CRM summary statistics')
-    
-    subparsers.add_parser('double-check', help='Double-check system integrity and recent work')
-    subparsers.add_parser('anticipate', help='Anticipate next questions/tasks and suggest actions')
-    subparsers.add_parser('status', help='Show comprehensive system status with actionable insights')
+    for name, help_text, arguments, handler in COMMANDS:
+        sub = subparsers.add_parser(name, help=help_text)
+        for flag, kwargs in arguments:
+            sub.add_argument(flag, **kwargs)
+        sub.set_defaults(func=handler)
     
     args = parser.parse_args()
     
@@ -875,38 +1165,7 @@ def main():
         parser.print_help()
         return
     
-    client = DirectoryClient()
-    
-    if args.command == 'list':
-        client.list_tasks(args.category, args.priority, args.status, args.include_done)
-    elif args.command == 'prune-tasks':
-        client.prune_old_done_tasks(args.days_old)
-    elif args.command == 'update-status':
-        client.update_task_status(args.task_file, args.status)
-    elif args.command == 'start':
-        client.start_task(args.task_file)
-    elif args.command == 'complete':
-        client.complete_task(args.task_file)
-    elif args.command == 'summary':
-        client.show_summary()
-    elif args.command == 'check-limits':
-        client.check_priority_limits()
-    elif args.command == 'crm-list':
-        client.list_contacts(args.location, args.company, args.name)
-    elif args.command == 'crm-add':
-        client.add_contact(args.name, args.email, args.company, args.location, args.phone, args.linkedin)
-    elif args.command == 'crm-update':
-        client.update_contact_field(args.name, args.field, args.value)
-    elif args.command == 'crm-search':
-        client.search_contacts(args.query)
-    elif args.command == 'crm-summary':
-        client.crm_summary()
-    elif args.command == 'double-check':
-        client.double_check_work()
-    elif args.command == 'anticipate':
-        client.anticipate_next()
-    elif args.command == 'status':
-        client.status()
+    args.func(DirectoryClient(), args)
 
 if __name__ == '__main__':
     main()
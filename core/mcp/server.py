@@ -5,15 +5,29 @@ MCP Server for Manager AI - TODO System and CRM Management
 
 import os
 import json
+import asyncio
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import Counter
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
 
 import yaml
 import re
+try:
+    # libyaml-backed loader/dumper, much faster than the pure-Python ones
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 from difflib import SequenceMatcher
+try:
+    # Optional: orjson serializes tool responses several times faster than json
+    import orjson
+except ImportError:
+    orjson = None
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
@@ -39,78 +53,348 @@ DEDUP_CONFIG = {
     "check_crm_mentions": True,   # Check for same people/companies in outreach
 }
 
+# Common words ignored when extracting keywords
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'from', 'up', 'out'})
+WORD_RE = re.compile(r'\b\w+\b')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Filename cleanup for auto-created tasks
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+# A BACKLOG.md bullet; indented bullets are subitems of the bullet above
+BACKLOG_ITEM_RE = re.compile(r'^(?P<indent>[ \t]*)- (?P<text>.*\S)', re.MULTILINE)
+
+# Backlog items matching any of these are too vague to turn into a task
+VAGUE_PATTERNS = [re.compile(p) for p in (
+    r'^(fix|update|improve|check|review|look at|work on)\s+(the|a|an)?\s*\w+$',  # "fix bug", "update docs"
+    r'^\w+\s+(stuff|thing|issue|problem)$',  # "database stuff", "API thing"
+    r'^(follow up|reach out|contact|email)$',  # Missing who/what
+    r'^(investigate|research|explore)\s*\w{0,20}$',  # Too broad
+)]
+
+# Category indicators, checked in this order by guess_category
+CATEGORY_KEYWORDS = (
+    ('outreach', ('email', 'contact', 'reach out', 'follow up', 'meeting', 'call')),
+    ('technical', ('code', 'api', 'database', 'deploy', 'fix', 'bug', 'implement')),
+    ('research', ('research', 'study', 'learn', 'understand', 'investigate')),
+    ('writing', ('write', 'draft', 'document', 'blog', 'article', 'proposal')),
+    ('admin', ('expense', 'invoice', 'schedule', 'calendar', 'organize')),
+    ('social', ('tweet', 'post', 'linkedin', 'social', 'twitter')),
+)
+# One zero-width lookahead per position finds every indicator (overlaps included) in a single scan;
+# alternatives are ordered by category so a position never hides a higher-priority match
+CATEGORY_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{category}>{'|'.join(map(re.escape, words))})" for category, words in CATEGORY_KEYWORDS
+) + ')')
+
+# Clarification questions for ambiguous items: (group, trigger words, questions), asked in this order
+CLARIFICATION_RULES = (
+    # Technical ambiguity
+    ('tech', ('fix', 'bug', 'error', 'issue'), (
+        "Which specific bug or error? Can you provide more details or error messages?",
+        "What component or feature is affected?",
+    )),
+    # Scope ambiguity
+    ('scope', ('update', 'improve', 'refactor'), (
+        "What specific aspects need updating/improvement?",
+        "What's the success criteria for this task?",
+    )),
+    # Missing target
+    ('target', ('email', 'contact', 'reach out', 'follow up'), (
+        "Who should be contacted? (Check CRM for existing contacts)",
+        "What's the purpose or goal of this outreach?",
+    )),
+    # Missing context
+    ('ctx', ('research', 'investigate', 'explore'), (
+        "What specific questions need to be answered?",
+        "What decisions will this research inform?",
+    )),
+)
+CLARIFICATION_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{group}>{'|'.join(map(re.escape, words))})" for group, words, _ in CLARIFICATION_RULES
+) + ')')
+
 def parse_yaml_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from markdown content"""
     if not content.startswith('---'):
         return {}, content
     
     try:
-        parts = content.split('---', 2)[1:]
-        if len(parts) >= 1:
-            metadata = yaml.safe_load(parts[0])
-            body = parts[1] if len(parts) > 1 else ''
-            return metadata or {}, body
+        # Slice at the closing delimiter line instead of splitting the whole file
+        end = content.find('\n---', 3)
+        if end < 0:
+            yaml_part, body = content[3:], ''
+        else:
+            yaml_part, body = content[3:end], content[end + 4:]
+        metadata = yaml.load(yaml_part, Loader=YamlLoader)
+        return metadata or {}, body
     except Exception as e:
         logger.error(f"Error parsing YAML: {e}")
         return {}, content
 
-def get_all_tasks() -> List[Dict[str, Any]]:
-    """Get all tasks from the Tasks directory"""
-    tasks = []
-    if not TASKS_DIR.exists():
-        return tasks
+def read_markdown_head(path: str, preview: int = 500, chunk: int = 8192) -> str:
+    """Read a markdown file only as far as its frontmatter plus a body preview"""
+    with open(path, 'r') as f:
+        content = f.read(chunk)
+        if len(content) == chunk and content.startswith('---'):
+            end = content.find('\n---', 3)
+            if end < 0 or end + 4 + preview > len(content):
+                content += f.read()
+    return content
+
+# Parsed markdown files by path: ((st_mtime_ns, st_size), metadata or None if unusable, derived data)
+_TASK_CACHE: Dict[str, tuple] = {}
+_CONTACT_CACHE: Dict[str, tuple] = {}
+# Bumped whenever a scan sees a directory's files change, so derived structures know when to rebuild
+_DIR_VERSIONS: Dict[str, int] = {}
+# Scans run in worker threads (asyncio.to_thread), so cache updates and version bumps are serialized
+_CACHE_LOCK = threading.Lock()
+
+# Per-file jobs in a batch before it's worth handing them to a thread pool
+PARALLEL_IO_MIN = 8
+MAX_IO_WORKERS = 16
+
+def run_parallel(func, jobs: list) -> list:
+    """Call func(*job) for each job in order, overlapping file I/O with threads for larger batches"""
+    if len(jobs) < PARALLEL_IO_MIN:
+        return [func(*job) for job in jobs]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(jobs))) as ex:
+        return list(ex.map(lambda job: func(*job), jobs))
+
+def parse_markdown_entry(path: str, name: str, key: tuple, derive=None) -> tuple:
+    """Parse one markdown file into a cache entry"""
+    try:
+        metadata, body = parse_yaml_frontmatter(read_markdown_head(path))
+        if metadata:
+            metadata['filename'] = name
+            metadata['body_content'] = body[:500] if body else ''
+        derived = derive(metadata) if derive and metadata else None
+        return key, metadata or None, derived
+    except Exception as e:
+        logger.error(f"Error reading {path}: {e}")
+        return None
+
+def load_markdown_dir(dir_path: Path, cache: Dict[str, tuple], derive=None) -> list:
+    """Parse every markdown file in a directory, re-reading only files that changed"""
+    # With derive, items are (metadata, derive(metadata)) pairs and the derived value is cached too
+    entries, misses = [], []
+    try:
+        it = os.scandir(dir_path)
+    except FileNotFoundError:
+        return []
     
-    for task_file in TASKS_DIR.glob('*.md'):
-        try:
-            with open(task_file, 'r') as f:
-                content = f.read()
-                metadata, body = parse_yaml_frontmatter(content)
-                if metadata:
-                    metadata['filename'] = task_file.name
-                    metadata['body_content'] = body[:500] if body else ''
-                    tasks.append(metadata)
-        except Exception as e:
-            logger.error(f"Error reading {task_file}: {e}")
+    with it:
+        for entry in it:
+            if entry.name.startswith('.') or not entry.name.endswith('.md'):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError as e:
+                logger.error(f"Error reading {entry.path}: {e}")
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            entries.append(entry.path)
+            cached = cache.get(entry.path)
+            if cached is None or cached[0] != key:
+                misses.append((entry.path, entry.name, key))
+    
+    # Cold scans are dominated by small-file reads, so parse misses concurrently
+    parsed = run_parallel(lambda path, name, key: parse_markdown_entry(path, name, key, derive), misses)
     
-    return tasks
+    items = []
+    with _CACHE_LOCK:
+        for (path, _, _), cached in zip(misses, parsed):
+            if cached is None:
+                cache.pop(path, None)
+            else:
+                cache[path] = cached
+        
+        # Drop entries for deleted files
+        stale = cache.keys() - set(entries)
+        for path in stale:
+            cache.pop(path, None)
+        
+        version_key = str(dir_path)
+        if misses or stale or version_key not in _DIR_VERSIONS:
+            _DIR_VERSIONS[version_key] = _DIR_VERSIONS.get(version_key, 0) + 1
+        
+        for path in entries:
+            cached = cache.get(path)
+            if cached is not None and cached[1] is not None:
+                # Hand out copies so callers can't modify the cache
+                items.append((dict(cached[1]), cached[2]) if derive else dict(cached[1]))
+    return items
+
+def json_default(value: Any) -> Any:
+    """Fallback encoder shared by the orjson and json paths, so both emit the same strings"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def to_json(result: Any) -> str:
+    """Serialize a tool result as indented JSON"""
+    if orjson is not None:
+        # Passthrough routes dates through json_default too, instead of orjson's own formatting
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(result, default=json_default, option=option).decode()
+    return json.dumps(result, indent=2, default=json_default)
 
-def calculate_similarity(text1: str, text2: str) -> float:
-    """Calculate similarity between two strings (0-1 score)"""
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+def json_response(result: Any) -> list[types.TextContent]:
+    """Wrap a tool result as the single TextContent MCP expects"""
+    # TextContent only carries str, so the orjson bytes are decoded exactly once, here
+    return [types.TextContent(type="text", text=to_json(result))]
+
+# Strings PyYAML always writes unquoted (when they don't resolve to another type and fit on one line)
+PLAIN_SCALAR_RE = re.compile(r'[A-Za-z0-9][A-Za-z0-9_./@+(),-]*(?: [A-Za-z0-9_./@+(),-]+)*')
+YAML_RESOLVER = yaml.resolver.Resolver()
+
+def yaml_scalar(value: Any) -> Optional[str]:
+    """Plain YAML text for simple ints/strings, or None if yaml.dump is needed"""
+    if type(value) is int:
+        return str(value)
+    if (type(value) is str and len(value) <= 60 and PLAIN_SCALAR_RE.fullmatch(value)
+            and YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == 'tag:yaml.org,2002:str'):
+        return value
+    return None
+
+def dump_yaml(metadata: dict) -> str:
+    """Serialize frontmatter metadata to block-style YAML"""
+    # Flat metadata of simple values is emitted directly; anything else goes through yaml.dump
+    lines = []
+    for key, value in metadata.items():
+        key_text = yaml_scalar(key) if type(key) is str else None
+        value_text = yaml_scalar(value)
+        if key_text is None or value_text is None:
+            lines = None
+            break
+        lines.append(f"{key_text}: {value_text}\n")
+    if lines:
+        return ''.join(lines)
+    return yaml.dump(metadata, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+def get_all_tasks() -> List[Dict[str, Any]]:
+    """Get all tasks from the Tasks directory"""
+    return load_markdown_dir(TASKS_DIR, _TASK_CACHE)
 
 def extract_keywords(text: str) -> set:
     """Extract meaningful keywords from text"""
     # Remove common words and extract meaningful terms
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'from', 'up', 'out'}
-    words = re.findall(r'\b\w+\b', text.lower())
-    return {w for w in words if w not in stop_words and len(w) > 2}
+    words = WORD_RE.findall(text.lower())
+    return {w for w in words if w not in STOP_WORDS and len(w) > 2}
 
-def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]], config: dict = DEDUP_CONFIG) -> List[Dict[str, Any]]:
-    """Find tasks similar to the given item"""
-    similar = []
-    item_keywords = extract_keywords(item)
-    
+@lru_cache(maxsize=4096)
+def title_keywords(title: str) -> frozenset:
+    """Keywords of a task title, memoized since titles rarely change between calls"""
+    return frozenset(extract_keywords(title))
+
+def normalize_title(text: str) -> str:
+    """Lowercase and collapse whitespace for exact-duplicate checks"""
+    return WHITESPACE_RE.sub(' ', text.strip().lower())
+
+def build_title_index(existing_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Precompute (task, title, lowercased title, keywords) for every open task, plus blocking indexes"""
+    entries = []
+    by_keyword = {}
+    by_normalized = {}
     for task in existing_tasks:
         # Skip completed tasks
         if task.get('status') == 'd':
             continue
-            
-        # Calculate title similarity
         title = task.get('title', '')
-        title_similarity = calculate_similarity(item, title)
+        keywords = title_keywords(title)
+        for keyword in keywords:
+            by_keyword.setdefault(keyword, []).append(len(entries))
+        by_normalized.setdefault(normalize_title(title), []).append(len(entries))
+        entries.append((task, title, title.lower(), keywords))
+    
+    by_length = sorted(range(len(entries)), key=lambda i: len(entries[i][2]))
+    return {
+        'entries': entries,
+        'by_keyword': by_keyword,
+        'by_normalized': by_normalized,
+        'lengths': [len(entries[i][2]) for i in by_length],
+        'length_order': by_length,
+    }
+
+_TITLE_INDEX_CACHE: Dict[str, Any] = {'version': None, 'index': None}
+
+def get_title_index(existing_tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """build_title_index() for the current tasks, reused until a scan sees Tasks/ change"""
+    version = _DIR_VERSIONS.get(str(TASKS_DIR))
+    if version is None or _TITLE_INDEX_CACHE['version'] != version:
+        _TITLE_INDEX_CACHE['index'] = build_title_index(existing_tasks)
+        _TITLE_INDEX_CACHE['version'] = version
+    return _TITLE_INDEX_CACHE['index']
+
+def candidate_titles(title_index: Dict[str, Any], item_lower: str, item_keywords: set, threshold: float) -> List[int]:
+    """Positions of titles that could reach the threshold, in index order"""
+    entries = title_index['entries']
+    # Without a shared keyword the score is at most 0.7 * real_quick_ratio(), which only
+    # depends on the two lengths, so other titles only need checking inside a length band
+    min_ratio = threshold / 0.7
+    if min_ratio <= 0:
+        return list(range(len(entries)))
+    
+    candidates = set()
+    for keyword in item_keywords:
+        candidates.update(title_index['by_keyword'].get(keyword, ()))
+    
+    if min_ratio <= 1:
+        length = len(item_lower)
+        # real_quick_ratio() = 2 * min(la, lb) / (la + lb); widen slightly for float rounding
+        lo = min_ratio * length / (2 - min_ratio) * (1 - 1e-9)
+        hi = (2 - min_ratio) * length / min_ratio * (1 + 1e-9)
+        lengths = title_index['lengths']
+        start, stop = bisect_left(lengths, lo), bisect_right(lengths, hi)
+        candidates.update(title_index['length_order'][start:stop])
+    
+    return sorted(candidates)
+
+def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]], config: dict = DEDUP_CONFIG,
+                       title_index: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Find tasks similar to the given item, optionally against a prebuilt title index"""
+    if title_index is None:
+        title_index = build_title_index(existing_tasks)
+    
+    similar = []
+    threshold = config['similarity_threshold']
+    item_keywords = extract_keywords(item)
+    item_lower = item.lower()
+    # One matcher per item (item as seq1, as before); each candidate title is swapped in with set_seq2
+    matcher = SequenceMatcher(None, item_lower)
+    
+    entries = title_index['entries']
+    for position in candidate_titles(title_index, item_lower, item_keywords, threshold):
+        task, title, title_lower, task_keywords = entries[position]
         
         # Calculate keyword overlap
-        task_keywords = extract_keywords(title)
         if item_keywords and task_keywords:
             keyword_overlap = len(item_keywords & task_keywords) / len(item_keywords | task_keywords)
         else:
             keyword_overlap = 0
         
+        if title_lower == item_lower:
+            # Exact duplicate title, no need to run the matcher
+            title_similarity = 1.0
+        else:
+            # real_quick_ratio() (length ratio) and quick_ratio() are cheap upper bounds
+            # on ratio(), so skip the full comparison when the bound can't reach the threshold
+            matcher.set_seq2(title_lower)
+            if (matcher.real_quick_ratio() * 0.7) + (keyword_overlap * 0.3) < threshold:
+                continue
+            if (matcher.quick_ratio() * 0.7) + (keyword_overlap * 0.3) < threshold:
+                continue
+            title_similarity = matcher.ratio()
+        
         # Combined score
         similarity_score = (title_similarity * 0.7) + (keyword_overlap * 0.3)
         
         # Check if it's a potential duplicate
-        if similarity_score >= config['similarity_threshold']:
+        if similarity_score >= threshold:
             similar.append({
                 'title': title,
                 'filename': task.get('filename', ''),
@@ -123,15 +407,20 @@ def find_similar_tasks(item: str, existing_tasks: List[Dict[str, Any]], config:
     similar.sort(key=lambda x: x['similarity_score'], reverse=True)
     return similar[:3]  # Return top 3 matches
 
+def find_exact_duplicates(item: str, title_index: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Open tasks whose title matches the item up to case and whitespace"""
+    entries = title_index['entries']
+    return [{
+        'title': entries[position][1],
+        'filename': entries[position][0].get('filename', ''),
+        'category': entries[position][0].get('category', ''),
+        'status': entries[position][0].get('status', ''),
+        'similarity_score': 1.0
+    } for position in title_index['by_normalized'].get(normalize_title(item), ())[:3]]
+
+@lru_cache(maxsize=4096)
 def is_ambiguous(item: str) -> bool:
     """Check if an item is too vague or ambiguous"""
-    vague_patterns = [
-        r'^(fix|update|improve|check|review|look at|work on)\s+(the|a|an)?\s*\w+$',  # "fix bug", "update docs"
-        r'^\w+\s+(stuff|thing|issue|problem)$',  # "database stuff", "API thing"
-        r'^(follow up|reach out|contact|email)$',  # Missing who/what
-        r'^(investigate|research|explore)\s*\w{0,20}$',  # Too broad
-    ]
-    
     item_lower = item.lower().strip()
     
     # Check if too short
@@ -139,8 +428,8 @@ def is_ambiguous(item: str) -> bool:
         return True
     
     # Check vague patterns
-    for pattern in vague_patterns:
-        if re.match(pattern, item_lower):
+    for pattern in VAGUE_PATTERNS:
+        if pattern.match(item_lower):
             return True
     
     return False
@@ -148,27 +437,12 @@ def is_ambiguous(item: str) -> bool:
 def generate_clarification_questions(item: str) -> List[str]:
     """Generate clarification questions for ambiguous items"""
     questions = []
-    item_lower = item.lower()
-    
-    # Technical ambiguity
-    if any(word in item_lower for word in ['fix', 'bug', 'error', 'issue']):
-        questions.append("Which specific bug or error? Can you provide more details or error messages?")
-        questions.append("What component or feature is affected?")
-    
-    # Scope ambiguity
-    if any(word in item_lower for word in ['update', 'improve', 'refactor']):
-        questions.append("What specific aspects need updating/improvement?")
-        questions.append("What's the success criteria for this task?")
-    
-    # Missing target
-    if any(word in item_lower for word in ['email', 'contact', 'reach out', 'follow up']):
-        questions.append("Who should be contacted? (Check CRM for existing contacts)")
-        questions.append("What's the purpose or goal of this outreach?")
     
-    # Missing context
-    if any(word in item_lower for word in ['research', 'investigate', 'explore']):
-        questions.append("What specific questions need to be answered?")
-        questions.append("What decisions will this research inform?")
+    # Find every triggered group in one pass, then ask in rule order
+    found = {m.lastgroup for m in CLARIFICATION_RE.finditer(item.lower())}
+    for group, _, group_questions in CLARIFICATION_RULES:
+        if group in found:
+            questions.extend(group_questions)
     
     # Generic catch-all
     if not questions:
@@ -177,44 +451,19 @@ def generate_clarification_questions(item: str) -> List[str]:
     
     return questions
 
+@lru_cache(maxsize=4096)
 def guess_category(item: str) -> str:
     """Guess the category based on item text"""
-    item_lower = item.lower()
-    
-    # Check for category indicators
-    if any(word in item_lower for word in ['email', 'contact', 'reach out', 'follow up', 'meeting', 'call']):
-        return 'outreach'
-    elif any(word in item_lower for word in ['code', 'api', 'database', 'deploy', 'fix', 'bug', 'implement']):
-        return 'technical'
-    elif any(word in item_lower for word in ['research', 'study', 'learn', 'understand', 'investigate']):
-        return 'research'
-    elif any(word in item_lower for word in ['write', 'draft', 'document', 'blog', 'article', 'proposal']):
-        return 'writing'
-    elif any(word in item_lower for word in ['expense', 'invoice', 'schedule', 'calendar', 'organize']):
-        return 'admin'
-    elif any(word in item_lower for word in ['tweet', 'post', 'linkedin', 'social', 'twitter']):
-        return 'social'
-    else:
-        return 'other'
-
-def generate_task_content(item: str, category: str) -> str:
-    """Generate rich task content based on item and category"""
-    
-    # Base structure that all tasks get
-    base_content = f"""## Overview
-{get_task_overview(item, category)}
-
-## Next Actions
-{get_next_actions(item, category)}
+    # Check for category indicators in one pass, then pick the highest-priority one
+    found = {m.lastgroup for m in CATEGORY_RE.finditer(item.lower())}
+    for category, _ in CATEGORY_KEYWORDS:
+        if category in found:
+            return category
+    return 'other'
 
-## Notes & Details
-- Task created from backlog processing
-- Category: {category}
-"""
-    
-    # Add category-specific sections
-    if category == 'outreach':
-        base_content += """
+# Category-specific sections appended to generated task content
+CATEGORY_TAIL = {
+    'outreach': """
 ## Draft Message
 [Draft outreach message here based on context]
 
@@ -222,9 +471,8 @@ def generate_task_content(item: str, category: str) -> str:
 - Check CRM for existing contact information
 - LinkedIn profile: [to be added]
 - Email: [to be added]
-"""
-    elif category == 'writing':
-        base_content += """
+""",
+    'writing': """
 ## Key Points
 - [Main argument or thesis]
 - [Supporting points]
@@ -235,9 +483,8 @@ def generate_task_content(item: str, category: str) -> str:
 
 ## Resources
 - [Related documents or references]
-"""
-    elif category == 'technical':
-        base_content += """
+""",
+    'technical': """
 ## Technical Requirements
 - [Specific technical details]
 - [Dependencies or prerequisites]
@@ -246,9 +493,8 @@ def generate_task_content(item: str, category: str) -> str:
 ## Implementation Notes
 - [Technical approach]
 - [Testing considerations]
-"""
-    elif category == 'research':
-        base_content += """
+""",
+    'research': """
 ## Research Questions
 - [What are we trying to learn?]
 - [Key hypotheses to test]
@@ -256,9 +502,8 @@ def generate_task_content(item: str, category: str) -> str:
 ## Sources to Explore
 - [Relevant resources]
 - [People to consult]
-"""
-    elif category == 'social':
-        base_content += """
+""",
+    'social': """
 ## Content Strategy
 - Platform: [Twitter/LinkedIn/etc]
 - Key message: [Core point]
@@ -266,9 +511,21 @@ def generate_task_content(item: str, category: str) -> str:
 
 ## Draft Post
 [Initial draft of social content]
-"""
-        
-    return base_content
+""",
+}
+
+def generate_task_content(item: str, category: str) -> str:
+    """Generate rich task content based on item and category"""
+    return f"""## Overview
+{get_task_overview(item, category)}
+
+## Next Actions
+{get_next_actions(item, category)}
+
+## Notes & Details
+- Task created from backlog processing
+- Category: {category}
+{CATEGORY_TAIL.get(category, '')}"""
 
 def get_task_overview(item: str, category: str) -> str:
     """Generate a contextual overview based on the task"""
@@ -342,23 +599,20 @@ def get_next_actions(item: str, category: str) -> str:
 
 def get_all_contacts() -> List[Dict[str, Any]]:
     """Get all contacts from the CRM directory"""
-    contacts = []
-    if not CRM_DIR.exists():
-        return contacts
-    
-    for contact_file in CRM_DIR.glob('*.md'):
-        try:
-            with open(contact_file, 'r') as f:
-                content = f.read()
-                metadata, body = parse_yaml_frontmatter(content)
-                if metadata:
-                    metadata['filename'] = contact_file.name
-                    metadata['body_content'] = body[:500] if body else ''
-                    contacts.append(metadata)
-        except Exception as e:
-            logger.error(f"Error reading {contact_file}: {e}")
-    
-    return contacts
+    return [contact for contact, _ in get_contact_index()]
+
+def contact_search_keys(contact: Dict[str, Any]) -> tuple:
+    """Lowercased (name, company, location, searchable text) for a contact"""
+    name, company, email, location, body = (
+        str(contact.get(field) or '').lower()
+        for field in ('name', 'company', 'email', 'location', 'body_content')
+    )
+    # NUL separator keeps a query from matching across two fields
+    return name, company, location, '\0'.join((name, company, email, location, body))
+
+def get_contact_index() -> List[tuple]:
+    """Get (contact, search keys) pairs, with keys computed once per file change"""
+    return load_markdown_dir(CRM_DIR, _CONTACT_CACHE, derive=contact_search_keys)
 
 def update_file_frontmatter(filepath: Path, updates: dict) -> bool:
     """Update YAML frontmatter in a file"""
@@ -370,17 +624,59 @@ def update_file_frontmatter(filepath: Path, updates: dict) -> bool:
         metadata.update(updates)
         
         # Reconstruct file
-        yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+        yaml_str = dump_yaml(metadata)
         new_content = f"---\n{yaml_str}---\n{body}"
         
-        with open(filepath, 'w') as f:
+        # Write a sibling temp file and swap it in so readers never see a partial file
+        tmp_path = filepath.with_suffix(filepath.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
             f.write(new_content)
+        os.replace(tmp_path, filepath)
+        
+        # Force the next directory scan to re-read this file
+        _TASK_CACHE.pop(str(filepath), None)
+        _CONTACT_CACHE.pop(str(filepath), None)
         
         return True
     except Exception as e:
         logger.error(f"Error updating {filepath}: {e}")
         return False
 
+def prune_done_task(path: str, name: str) -> Optional[str]:
+    """Delete a task file if it's marked done, returning its name when deleted"""
+    try:
+        # Status lives in the frontmatter, so the body is never read
+        metadata, _ = parse_yaml_frontmatter(read_markdown_head(path, preview=0, chunk=4096))
+        if metadata.get('status') == 'd':
+            os.unlink(path)
+            return name
+    except Exception as e:
+        logger.error(f"Error processing {path}: {e}")
+    return None
+
+def prune_done_tasks(cutoff_ts: float) -> List[str]:
+    """Delete done tasks last modified before cutoff_ts, returning their filenames"""
+    # One scandir pass; only files older than the cutoff are opened
+    candidates = []
+    with os.scandir(TASKS_DIR) as it:
+        for entry in it:
+            if entry.name.startswith('.') or not entry.name.endswith('.md'):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff_ts:
+                    candidates.append((entry.path, entry.name))
+            except OSError as e:
+                logger.error(f"Error processing {entry.path}: {e}")
+    
+    # Each check is independent file I/O, so overlap them for larger batches
+    results = run_parallel(prune_done_task, candidates)
+    return [name for name in results if name]
+
+def write_text_file(path: Path, content: str) -> None:
+    """Write a whole text file"""
+    with open(path, 'w') as f:
+        f.write(content)
+
 # Create the MCP server
 app = Server("manager-ai-mcp")
 
@@ -531,7 +827,7 @@ async def handle_call_tool(
     """Handle tool calls"""
     
     if name == "list_tasks":
-        tasks = get_all_tasks()
+        tasks = await asyncio.to_thread(get_all_tasks)
         
         # Apply filters
         if arguments:
@@ -558,7 +854,7 @@ async def handle_call_tool(
             "count": len(tasks),
             "filters_applied": arguments or {}
         }
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "create_task":
         title = arguments['title']
@@ -581,7 +877,7 @@ async def handle_call_tool(
         }
         
         # Create file content
-        yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+        yaml_str = dump_yaml(metadata)
         file_content = f"---\n{yaml_str}---\n\n# {title}\n\n{content}"
         
         try:
@@ -599,7 +895,7 @@ async def handle_call_tool(
                 "error": str(e)
             }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "update_task_status":
         task_file = arguments['task_file']
@@ -623,21 +919,29 @@ async def handle_call_tool(
                 "new_status": status_names.get(status, status)
             }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "get_task_summary":
-        tasks = get_all_tasks()
-        active_tasks = [t for t in tasks if t.get('status') != 'd']
+        tasks = await asyncio.to_thread(get_all_tasks)
         
-        by_priority = Counter(t.get('priority', 'P2') for t in active_tasks)
-        by_category = Counter(t.get('category', 'other') for t in active_tasks)
-        by_status = Counter(t.get('status', 'n') for t in tasks)
+        # Aggregate everything in a single pass
+        by_priority, by_category, by_status = Counter(), Counter(), Counter()
+        minutes_by_priority = {'P0': 0, 'P1': 0, 'P2': 0, 'P3': 0}
+        active_count = 0
+        for t in tasks:
+            by_status[t.get('status', 'n')] += 1
+            if t.get('status') == 'd':
+                continue
+            active_count += 1
+            by_priority[t.get('priority', 'P2')] += 1
+            by_category[t.get('category', 'other')] += 1
+            priority = t.get('priority')
+            if priority in minutes_by_priority:
+                minutes_by_priority[priority] += t.get('estimated_time', 30)
         
         # Calculate time estimates
         time_by_priority = {}
-        for priority in ['P0', 'P1', 'P2', 'P3']:
-            priority_tasks = [t for t in active_tasks if t.get('priority') == priority]
-            total_time = sum(t.get('estimated_time', 30) for t in priority_tasks)
+        for priority, total_time in minutes_by_priority.items():
             time_by_priority[priority] = {
                 'total_minutes': total_time,
                 'total_hours': round(total_time / 60, 1)
@@ -645,17 +949,18 @@ async def handle_call_tool(
         
         result = {
             "total_tasks": len(tasks),
-            "active_tasks": len(active_tasks),
+            "active_tasks": active_count,
             "by_priority": dict(by_priority),
             "by_category": dict(by_category),
             "by_status": dict(by_status),
             "time_by_priority": time_by_priority
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "check_priority_limits":
-        tasks = [t for t in get_all_tasks() if t.get('status') != 'd']
+        tasks = await asyncio.to_thread(get_all_tasks)
+        tasks = [t for t in tasks if t.get('status') != 'd']
         by_priority = Counter(t.get('priority', 'P2') for t in tasks)
         
         thresholds = {'P0': 3, 'P1': 5, 'P2': 10}
@@ -672,24 +977,21 @@ async def handle_call_tool(
             "balanced": len(alerts) == 0
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "list_contacts":
-        contacts = get_all_contacts()
+        index = await asyncio.to_thread(get_contact_index)
+        arguments = arguments or {}
         
-        # Apply filters
-        if arguments:
-            if arguments.get('location'):
-                locations = [l.strip().lower() for l in arguments['location'].split(',')]
-                contacts = [c for c in contacts if any(loc in (c.get('location') or '').lower() for loc in locations)]
-            
-            if arguments.get('company'):
-                company_lower = arguments['company'].lower()
-                contacts = [c for c in contacts if company_lower in (c.get('company') or '').lower()]
-            
-            if arguments.get('name'):
-                name_lower = arguments['name'].lower()
-                contacts = [c for c in contacts if name_lower in (c.get('name') or '').lower()]
+        # Apply filters against the precomputed lowercase keys
+        locations = [l.strip().lower() for l in arguments['location'].split(',')] if arguments.get('location') else None
+        company_lower = arguments['company'].lower() if arguments.get('company') else None
+        name_lower = arguments['name'].lower() if arguments.get('name') else None
+        
+        contacts = [c for c, (name_l, company_l, location_l, _) in index
+                    if (locations is None or any(loc in location_l for loc in locations))
+                    and (company_lower is None or company_lower in company_l)
+                    and (name_lower is None or name_lower in name_l)]
         
         result = {
             "contacts": contacts,
@@ -697,7 +999,7 @@ async def handle_call_tool(
             "filters_applied": arguments or {}
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "add_contact":
         name = arguments['name']
@@ -723,7 +1025,7 @@ async def handle_call_tool(
                     metadata[field] = arguments[field]
             
             # Create file content
-            yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+            yaml_str = dump_yaml(metadata)
             file_content = f"---\n{yaml_str}---\n\n# {name}\n\n## Notes\n"
             
             try:
@@ -741,20 +1043,12 @@ async def handle_call_tool(
                     "error": str(e)
                 }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "search_contacts":
-        contacts = get_all_contacts()
         query = arguments['query'].lower()
-        
-        matches = []
-        for c in contacts:
-            if (query in (c.get('name') or '').lower() or
-                query in (c.get('company') or '').lower() or
-                query in str(c.get('email') or '').lower() or
-                query in (c.get('location') or '').lower() or
-                query in (c.get('body_content') or '').lower()):
-                matches.append(c)
+        index = await asyncio.to_thread(get_contact_index)
+        matches = [c for c, keys in index if query in keys[3]]
         
         result = {
             "matches": matches,
@@ -762,25 +1056,34 @@ async def handle_call_tool(
             "query": arguments['query']
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "get_system_status":
-        all_tasks = get_all_tasks()
-        active_tasks = [t for t in all_tasks if t.get('status') != 'd']
-        contacts = get_all_contacts()
+        all_tasks = await asyncio.to_thread(get_all_tasks)
+        contacts = await asyncio.to_thread(get_all_contacts)
         
-        priority_counts = Counter(task['priority'] for task in active_tasks)
-        status_counts = Counter(task['status'] for task in active_tasks)
-        category_counts = Counter(task['category'] for task in active_tasks)
+        # Count active tasks by priority, status and category in one pass
+        active_count = 0
+        priority_counts, status_counts, category_counts = Counter(), Counter(), Counter()
+        for task in all_tasks:
+            if task.get('status') == 'd':
+                continue
+            active_count += 1
+            priority_counts[task['priority']] += 1
+            status_counts[task['status']] += 1
+            category_counts[task['category']] += 1
         
         # Check backlog
         backlog_items = 0
         backlog_file = BASE_DIR / 'BACKLOG.md'
-        if backlog_file.exists():
-            with open(backlog_file, 'r') as f:
-                content = f.read().strip()
-                if content and content != 'all done!':
-                    backlog_items = len([l for l in content.split('\n') if l.strip().startswith('-')])
+        try:
+            backlog_size = backlog_file.stat().st_size
+        except FileNotFoundError:
+            backlog_size = 0
+        if backlog_size:
+            content = backlog_file.read_text().strip()
+            if content != 'all done!':
+                backlog_items = len([l for l in content.split('\n') if l.strip().startswith('-')])
         
         # Time insights
         now = datetime.now()
@@ -796,7 +1099,7 @@ async def handle_call_tool(
             time_insights.append("End of day - quick admin tasks")
         
         result = {
-            "total_active_tasks": len(active_tasks),
+            "total_active_tasks": active_count,
             "total_contacts": len(contacts),
             "priority_distribution": dict(priority_counts),
             "status_distribution": dict(status_counts),
@@ -806,19 +1109,24 @@ async def handle_call_tool(
             "timestamp": now.isoformat()
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "process_backlog":
         backlog_file = BASE_DIR / 'BACKLOG.md'
         
-        if not backlog_file.exists():
+        # One stat() covers both the existence check and the empty-file fast path
+        try:
+            backlog_size = backlog_file.stat().st_size
+        except FileNotFoundError:
+            backlog_size = None
+        
+        if backlog_size is None:
             result = {
                 "success": False,
                 "error": "BACKLOG.md not found"
             }
         else:
-            with open(backlog_file, 'r') as f:
-                content = f.read().strip()
+            content = backlog_file.read_text().strip() if backlog_size else ''
             
             if not content or content == 'all done!':
                 result = {
@@ -827,25 +1135,19 @@ async def handle_call_tool(
                     "message": "Backlog is already clear"
                 }
             else:
-                # Parse items
-                lines = content.split('\n')
+                # Parse items in one regex scan
                 items = []
                 current_item = None
                 
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped.startswith('- '):
-                        if current_item:
-                            items.append(current_item)
+                for match in BACKLOG_ITEM_RE.finditer(content):
+                    if match['indent'] and current_item:
+                        current_item['subitems'].append(match['text'])
+                    else:
                         current_item = {
-                            'text': stripped[2:],
+                            'text': match['text'],
                             'subitems': []
                         }
-                    elif stripped.startswith('  - ') and current_item:
-                        current_item['subitems'].append(stripped[4:])
-                
-                if current_item:
-                    items.append(current_item)
+                        items.append(current_item)
                 
                 result = {
                     "success": True,
@@ -854,14 +1156,17 @@ async def handle_call_tool(
                     "count": len(items)
                 }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "clear_backlog":
         backlog_file = BASE_DIR / 'BACKLOG.md'
         
         try:
-            with open(backlog_file, 'w') as f:
+            # Swap in the cleared file atomically so a crash never leaves BACKLOG.md empty
+            tmp_path = backlog_file.with_suffix('.md.tmp')
+            with open(tmp_path, 'w') as f:
                 f.write("all done!")
+            os.replace(tmp_path, backlog_file)
             
             result = {
                 "success": True,
@@ -873,25 +1178,12 @@ async def handle_call_tool(
                 "error": str(e)
             }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "prune_completed_tasks":
         days = arguments.get('days', 30) if arguments else 30
-        cutoff_date = datetime.now() - timedelta(days=days)
-        deleted = []
-        
-        for task_file in TASKS_DIR.glob('*.md'):
-            try:
-                mtime = datetime.fromtimestamp(task_file.stat().st_mtime)
-                if mtime < cutoff_date:
-                    with open(task_file, 'r') as f:
-                        content = f.read()
-                        metadata, _ = parse_yaml_frontmatter(content)
-                        if metadata.get('status') == 'd':
-                            task_file.unlink()
-                            deleted.append(task_file.name)
-            except Exception as e:
-                logger.error(f"Error processing {task_file}: {e}")
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        deleted = await asyncio.to_thread(prune_done_tasks, cutoff_ts)
         
         result = {
             "success": True,
@@ -900,40 +1192,45 @@ async def handle_call_tool(
             "message": f"Deleted {len(deleted)} tasks older than {days} days"
         }
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     elif name == "process_backlog_with_dedup":
         items = arguments.get('items', [])
         auto_create = arguments.get('auto_create', False)
         
         if not items:
-            return [types.TextContent(type="text", text=json.dumps({
+            return json_response({
                 "error": "No items provided to process"
-            }, indent=2))]
+            })
         
-        existing_tasks = get_all_tasks()
-        existing_contacts = get_all_contacts()
+        existing_tasks = await asyncio.to_thread(get_all_tasks)
+        # Tokenize existing titles once, and not again until Tasks/ changes
+        title_index = get_title_index(existing_tasks)
         
+        # Bind the result lists once so the item loop skips the per-append dict lookups
+        new_tasks, potential_duplicates, needs_clarification, auto_created = [], [], [], []
         result = {
-            "new_tasks": [],
-            "potential_duplicates": [],
-            "needs_clarification": [],
-            "auto_created": [],
+            "new_tasks": new_tasks,
+            "potential_duplicates": potential_duplicates,
+            "needs_clarification": needs_clarification,
+            "auto_created": auto_created,
             "summary": {}
         }
+        pending_writes = {}
         
         for item in items:
-            # Check for duplicates
-            similar_tasks = find_similar_tasks(item, existing_tasks)
+            # Check for duplicates; exact repeats skip fuzzy scoring entirely
+            similar_tasks = (find_exact_duplicates(item, title_index)
+                             or find_similar_tasks(item, existing_tasks, title_index=title_index))
             
             if similar_tasks:
-                result["potential_duplicates"].append({
+                potential_duplicates.append({
                     "item": item,
                     "similar_tasks": similar_tasks,
                     "recommended_action": "merge" if similar_tasks[0]['similarity_score'] > 0.8 else "review"
                 })
             elif is_ambiguous(item):
-                result["needs_clarification"].append({
+                needs_clarification.append({
                     "item": item,
                     "questions": generate_clarification_questions(item),
                     "suggestions": [
@@ -944,9 +1241,10 @@ async def handle_call_tool(
                 })
             else:
                 # This is a new, clear task
-                result["new_tasks"].append({
+                category = guess_category(item)
+                new_tasks.append({
                     "item": item,
-                    "suggested_category": guess_category(item),
+                    "suggested_category": category,
                     "suggested_priority": "P2",  # Default priority
                     "ready_to_create": True
                 })
@@ -954,56 +1252,59 @@ async def handle_call_tool(
                 # Auto-create if requested
                 if auto_create:
                     # Create the task file
-                    safe_filename = re.sub(r'[^\w\s-]', '', item).strip()
-                    safe_filename = re.sub(r'[-\s]+', ' ', safe_filename)
+                    safe_filename = UNSAFE_FILENAME_CHARS_RE.sub('', item).strip()
+                    safe_filename = FILENAME_SEPARATORS_RE.sub(' ', safe_filename)
                     task_file = TASKS_DIR / f"{safe_filename}.md"
                     
                     metadata = {
                         "title": item,
-                        "category": guess_category(item),
+                        "category": category,
                         "priority": "P2",
                         "status": "n",
                         "estimated_time": 60
                     }
                     
-                    yaml_str = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
+                    yaml_str = dump_yaml(metadata)
                     
                     # Generate richer task content based on category
                     task_content = generate_task_content(item, metadata['category'])
                     content = f"---\n{yaml_str}---\n\n# {item}\n\n{task_content}"
                     
-                    with open(task_file, 'w') as f:
-                        f.write(content)
-                    
-                    result["auto_created"].append(safe_filename + ".md")
+                    # Queue the write; a later item with the same filename replaces it, as before
+                    pending_writes[task_file] = content
+                    auto_created.append(safe_filename + ".md")
+        
+        # Write all auto-created task files in one batch
+        if pending_writes:
+            await asyncio.to_thread(run_parallel, write_text_file, list(pending_writes.items()))
         
         # Add summary
         result["summary"] = {
             "total_items": len(items),
-            "new_tasks": len(result["new_tasks"]),
-            "duplicates_found": len(result["potential_duplicates"]),
-            "needs_clarification": len(result["needs_clarification"]),
-            "auto_created": len(result["auto_created"]),
+            "new_tasks": len(new_tasks),
+            "duplicates_found": len(potential_duplicates),
+            "needs_clarification": len(needs_clarification),
+            "auto_created": len(auto_created),
             "recommendations": []
         }
         
         # Add recommendations
-        if result["potential_duplicates"]:
+        if potential_duplicates:
             result["summary"]["recommendations"].append(
-                f"Review {len(result['potential_duplicates'])} potential duplicates before creating tasks"
+                f"Review {len(potential_duplicates)} potential duplicates before creating tasks"
             )
         
-        if result["needs_clarification"]:
+        if needs_clarification:
             result["summary"]["recommendations"].append(
-                f"Clarify {len(result['needs_clarification'])} ambiguous items for better task definition"
+                f"Clarify {len(needs_clarification)} ambiguous items for better task definition"
             )
         
-        if result["new_tasks"] and not auto_create:
+        if new_tasks and not auto_create:
             result["summary"]["recommendations"].append(
-                f"Ready to create {len(result['new_tasks'])} new tasks - use auto_create=true or create manually"
+                f"Ready to create {len(new_tasks)} new tasks - use auto_create=true or create manually"
             )
         
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return json_response(result)
     
     else:
         return [types.TextContent(
@@ -1017,6 +1318,7 @@ async def main():
     logger.info(f"Working directory: {BASE_DIR}")
     logger.info(f"Tasks directory: {TASKS_DIR}")
     logger.info(f"CRM directory: {CRM_DIR}")
+    logger.info(f"YAML backend: {'libyaml' if YamlLoader is not yaml.SafeLoader else 'pure Python'}")
     
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await app.run(
@@ -1033,5 +1335,4 @@ async def main():
         )
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -6,22 +6,52 @@ Creates necessary directories and copies template files
 
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def load_answers():
+    """Onboarding answers from PERSONAL_OS_INIT_YAML, or None to prompt interactively"""
+    blob = os.environ.get('PERSONAL_OS_INIT_YAML')
+    if blob:
+        import yaml
+        try:
+            answers = yaml.safe_load(blob) or {}
+        except yaml.YAMLError as e:
+            sys.exit(f"❌ PERSONAL_OS_INIT_YAML is not valid YAML: {e}")
+        if not isinstance(answers, dict):
+            sys.exit("❌ PERSONAL_OS_INIT_YAML must be a YAML mapping, e.g. '{role: Senior PM, objectives: [Ship v2]}'")
+        objectives = answers.get('objectives') or []
+        if isinstance(objectives, str):
+            objectives = [objectives]
+        elif not isinstance(objectives, list):
+            sys.exit("❌ PERSONAL_OS_INIT_YAML 'objectives' must be a list or a single string")
+        for i, objective in enumerate(objectives[:3]):
+            answers.setdefault(f'objective{i+1}', objective)
+        return answers
+    # Without a terminal there is nobody to answer, so skip the questions
+    return None if sys.stdin.isatty() else {}
+
 def setup():
     """Setup the task management system"""
     print("🚀 Setting up Personal OS Task Management System...")
     
     base_dir = Path.cwd()
+    answers = load_answers()
+    
+    def ask(key, prompt):
+        if answers is None:
+            return input(prompt).strip()
+        return str(answers.get(key) or '').strip()
+    base = str(base_dir)
     
-    # Create directories
+    # Create directories; makedirs doubles as the existence check
     directories = ['Tasks', 'CRM', 'Knowledge', 'examples']
     for dir_name in directories:
-        dir_path = base_dir / dir_name
-        if not dir_path.exists():
-            dir_path.mkdir(parents=True)
+        try:
+            os.makedirs(os.path.join(base, dir_name))
             print(f"✅ Created directory: {dir_name}/")
-        else:
+        except FileExistsError:
             print(f"📁 Directory exists: {dir_name}/")
     
     # Copy template files
@@ -32,22 +62,32 @@ def setup():
         'core/templates/GOALS.md': 'GOALS.md'
     }
     
+    # Ask about overwrites up front, then copy the accepted templates concurrently
+    copies = []
     for source, dest in templates.items():
-        source_path = base_dir / source
-        dest_path = base_dir / dest
+        source_path = os.path.join(base, source)
+        dest_path = os.path.join(base, dest)
         
-        if source_path.exists():
-            if dest_path.exists():
-                response = input(f"⚠️  {dest} already exists. Overwrite? (y/n): ")
+        if os.path.exists(source_path):
+            if os.path.exists(dest_path):
+                if answers is None:
+                    response = input(f"⚠️  {dest} already exists. Overwrite? (y/n): ")
+                else:
+                    response = 'y' if answers.get('overwrite') else 'n'
                 if response.lower() != 'y':
                     print(f"⏭️  Skipped: {dest}")
                     continue
             
-            shutil.copy2(source_path, dest_path)
-            print(f"✅ Copied: {source} → {dest}")
+            copies.append((source, dest, source_path, dest_path))
         else:
             print(f"❌ Template not found: {source}")
     
+    if copies:
+        with ThreadPoolExecutor(max_workers=len(copies)) as pool:
+            list(pool.map(lambda c: shutil.copy2(c[2], c[3]), copies))
+        for source, dest, _, _ in copies:
+            print(f"✅ Copied: {source} → {dest}")
+    
     # Interactive GOALS setup
     goals_path = base_dir / 'GOALS.md'
     if goals_path.exists() and (goals_path.read_text().count('[') > 5):
@@ -56,10 +96,10 @@ def setup():
         print("\n📋 Let's set up your goals and priorities...")
         print("(Press Enter to skip any question)\n")
         
-        role = input("What's your current role? (e.g., Senior PM, Engineering Manager): ").strip()
-        objective1 = input("What's your #1 objective this quarter? ").strip()
-        objective2 = input("What's your #2 objective this quarter? ").strip()
-        objective3 = input("What's your #3 objective this quarter? ").strip()
+        role = ask('role', "What's your current role? (e.g., Senior PM, Engineering Manager): ")
+        objective1 = ask('objective1', "What's your #1 objective this quarter? ")
+        objective2 = ask('objective2', "What's your #2 objective this quarter? ")
+        objective3 = ask('objective3', "What's your #3 objective this quarter? ")
         
         # Update GOALS.md with user input if provided
         if any([role, objective1, objective2, objective3]):
@@ -104,17 +144,17 @@ def setup():
         # Professional goals
         print("1. PROFESSIONAL: What does career success look like for you in 12 months?")
         print("   (e.g., role, skills, income, impact, autonomy)")
-        professional = input("   → ").strip()
+        professional = ask('professional', "   → ")
         
         # Personal/Life goals
         print("\n2. PERSONAL: What would make your life feel rich and fulfilling?")
         print("   (e.g., relationships, health, hobbies, experiences, learning)")
-        personal = input("   → ").strip()
+        personal = ask('personal', "   → ")
         
         # Current focus
         print("\n3. NEXT 90 DAYS: What 1-3 things would create the most momentum?")
         print("   (Be specific - what will you ship, launch, or complete?)")
-        focus = input("   → ").strip()
+        focus = ask('focus', "   → ")
         
         goals_content = f"""# Goals & Life Design
 